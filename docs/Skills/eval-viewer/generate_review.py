@@ -3,7 +3,32 @@
 
 Reads the workspace directory, discovers runs (directories with outputs/),
 embeds all output data into a self-contained HTML page, and serves it via
-a tiny HTTP server. Feedback auto-saves to feedback.json in the workspace.
+a tiny HTTP server. Feedback auto-saves to the workspace: each edit is
+appended to feedback.log.jsonl, which is periodically compacted into the
+feedback.json snapshot (always on submit and on shutdown).
+
+Discovery skips virtualenvs and anything matched by --exclude globs or
+.reviewignore files, stops at --max-depth if given, and reads the standard
+eval-*/<config>/run-* layout without walking it.
+
+In server mode the page only carries a lightweight run index (prompt,
+grading and output file names); the viewer fetches each run's outputs from
+/api/runs/<run_id> when it is opened. Binary outputs (images, PDFs,
+spreadsheets, downloads) are referenced by /files/<run_id>/<name> URLs and
+streamed from disk rather than base64-inlined. The viewer subscribes to
+/api/events (Server-Sent Events) and merges runs that are added or changed
+while it is open, so a running benchmark can be followed without reloading.
+--static still embeds everything into a single self-contained file, written
+incrementally so memory use does not grow with the size of the workspace.
+Identical output files (across runs and iterations) are embedded once.
+Inline output data is capped per file and per page (--max-inline-file,
+--max-inline-page): oversized text gets a head/tail preview, oversized
+images a thumbnail (with Pillow installed), and anything else a link to the
+original file.
+
+With --previous-workspace, text outputs are also diffed against the previous
+iteration (in worker processes, cached by content hash) and the viewer shows
+the unified diffs next to the previous output.
 
 Usage:
     python generate_review.py <workspace-path> [--port PORT] [--skill-name NAME]
@@ -14,18 +39,41 @@ No dependencies beyond the Python stdlib are required.
 
 import argparse
 import base64
+import difflib
+import gzip
+import hashlib
+import io
 import json
 import mimetypes
+import multiprocessing
 import os
 import re
+import select
 import signal
+import socket
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import partial
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # Optional: responses fall back to gzip without it
+    brotli = None
+
+try:
+    from PIL import Image
+except ImportError:  # Optional: oversized images are linked instead of thumbnailed
+    Image = None
 
 # Files to exclude from output listings
 METADATA_FILES = {"transcript.md", "user_notes.md", "metrics.json"}
@@ -37,9 +85,69 @@ TEXT_EXTENSIONS = {
     ".java", ".c", ".cpp", ".h", ".hpp", ".sql", ".r", ".toml",
 }
 
+# Placeholder in viewer.html replaced by the embedded data
+EMBEDDED_DATA_MARKER = "/*__EMBEDDED_DATA__*/"
+
+# Directory names never searched for runs (see RunDiscovery)
+DEFAULT_EXCLUDES = ("node_modules", ".git", "__pycache__", "skill", "inputs")
+
+# Per-directory ignore file (gitignore syntax) honoured during run discovery
+IGNORE_FILE_NAME = ".reviewignore"
+
+# Deepest directory level searched for runs, relative to the workspace (None = no limit)
+DEFAULT_MAX_DEPTH = None
+
 # Extensions we render as inline images
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp"}
 
+# Chunk size for streaming output files over HTTP
+FILE_CHUNK_SIZE = 64 * 1024
+
+# Read size when base64-encoding files into a static page; a multiple of 3
+# so the encoded chunks concatenate without inner padding
+B64_CHUNK_SIZE = 3 * 16 * 1024
+
+# Default inline limits in bytes (see EmbedBudget); base64 counts as encoded
+DEFAULT_MAX_INLINE_FILE = 10 * 1024 * 1024
+DEFAULT_MAX_INLINE_PAGE = 200 * 1024 * 1024
+
+# Head + tail kept when a text output is too large to inline in full
+TEXT_PREVIEW_BYTES = 64 * 1024
+
+# Longest side of thumbnails generated for oversized images
+THUMBNAIL_PX = 800
+
+# Diffs against the previous iteration read at most this much of each file
+# and keep at most this many lines
+MAX_DIFF_BYTES = 2 * 1024 * 1024
+MAX_DIFF_LINES = 5000
+DIFF_CONTEXT = 3
+
+# Text read per output file when indexing runs for /api/search
+MAX_INDEX_BYTES = 1024 * 1024
+
+# Entries DiffCache keeps (least recently used dropped first): computed
+# diffs, and file hashes by path
+MAX_CACHED_DIFFS = 4096
+MAX_CACHED_HASHES = 16384
+
+# Responses smaller than this are sent uncompressed
+COMPRESS_MIN_BYTES = 1024
+
+# Identifies this server process in page ETags, so a page cached from an
+# earlier process (whose run cache may have reached the same version)
+# is not revalidated as current
+SERVER_INSTANCE = f"{os.getpid():x}-{time.time_ns():x}"
+
+# Append-only feedback log kept next to feedback.json
+FEEDBACK_LOG_NAME = "feedback.log.jsonl"
+
+# Seconds between SSE keep-alive comments on an idle event stream
+SSE_HEARTBEAT_SECONDS = 15
+
+# Open /api/events streams allowed at once; they don't count against --max-workers
+MAX_EVENT_STREAMS = 8
+
 # MIME type overrides for common types
 MIME_OVERRIDES = {
     ".svg": "image/svg+xml",
@@ -57,33 +165,266 @@ def get_mime_type(path: Path) -> str:
     return mime or "application/octet-stream"
 
 
-def find_runs(workspace: Path) -> list[dict]:
-    """Recursively find directories that contain an outputs/ subdirectory."""
+def find_runs(
+    workspace: Path, embed_outputs: bool = True, discovery: "RunDiscovery | None" = None,
+) -> list[dict]:
+    """Recursively find directories that contain an outputs/ subdirectory.
+
+    With embed_outputs=False, each run's outputs are name/type stubs only
+    (see build_run), which is what the server's run index is built from.
+    """
     runs: list[dict] = []
-    _find_runs_recursive(workspace, workspace, runs)
+    for run_dir in find_run_dirs(workspace, discovery):
+        run = build_run(workspace, run_dir, embed_outputs=embed_outputs)
+        if run:
+            runs.append(run)
     runs.sort(key=lambda r: (r.get("eval_id", float("inf")), r["id"]))
     return runs
 
 
-def _find_runs_recursive(root: Path, current: Path, runs: list[dict]) -> None:
-    if not current.is_dir():
-        return
+def find_run_dirs(workspace: Path, discovery: "RunDiscovery | None" = None) -> list[Path]:
+    """Return every run directory (one containing outputs/) under workspace."""
+    return (discovery or RunDiscovery()).find(workspace)
+
+
+# ---------------------------------------------------------------------------
+# Run discovery
+# ---------------------------------------------------------------------------
+
+def glob_to_regex(pattern: str) -> re.Pattern:
+    """Compile a gitignore-style glob over posix paths.
+
+    "*" and "?" stay within one path component, "**" spans any number of
+    them, and "[...]" classes (with "!" negation) are supported.
+    """
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        c = pattern[i]
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[" and "]" in pattern[i + 2:]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return re.compile("".join(out) + r"\Z")
+
+
+class IgnoreRules:
+    """Directory exclusion rules with .gitignore semantics.
+
+    A pattern containing a slash (other than a trailing one) is anchored to
+    the directory its rules came from; otherwise it matches a directory name
+    at any depth below it. "!" re-includes, and the last matching rule wins.
+    Rules are immutable; extended() returns a copy with more rules, so a
+    subdirectory's ignore file doesn't leak into its siblings.
+    """
+
+    def __init__(self, rules: tuple = ()):
+        self.rules = rules  # (base, regex, anchored, negate)
+
+    def extended(self, patterns, base: str = "") -> "IgnoreRules":
+        rules = list(self.rules)
+        for line in patterns:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            if line.startswith("\\"):
+                line = line[1:]
+            line = line.rstrip("/")
+            anchored = "/" in line
+            rules.append((base, glob_to_regex(line.lstrip("/")), anchored, negate))
+        return IgnoreRules(tuple(rules))
+
+    def ignored(self, rel: str) -> bool:
+        """Whether the directory at rel (posix, relative to the root) is excluded."""
+        result = False
+        for base, regex, anchored, negate in self.rules:
+            if base:
+                if not rel.startswith(base + "/"):
+                    continue
+                sub = rel[len(base) + 1:]
+            else:
+                sub = rel
+            target = sub if anchored else sub.rsplit("/", 1)[-1]
+            if regex.match(target):
+                result = not negate
+        return result
+
+
+class RunDiscovery:
+    """Finds run directories (those containing outputs/) under a workspace.
+
+    The walk uses os.scandir and never descends into a run, a virtualenv
+    (any directory with a pyvenv.cfg), anything matched by the exclude
+    globs or by an ignore file (gitignore syntax, read in every directory
+    walked), or below max_depth levels. With fast_path, an eval-* directory
+    laid out as eval-*/<config>/outputs or eval-*/<config>/run-*/outputs is
+    read directly instead of walked. It must match that layout exactly:
+    any other directory in it, an ignore file or a virtualenv in it, or
+    runs that would fall below max_depth send it to the full walk, so both
+    find the same runs.
+    Include globs, if any, then keep only runs whose relative path matches
+    one of them (a glob without a slash matches any path component).
+
+    After find(), depth_skipped is the number of directories the last walk
+    left unsearched because of max_depth.
+    """
+
+    def __init__(
+        self,
+        include: tuple[str, ...] = (),
+        exclude: tuple[str, ...] = DEFAULT_EXCLUDES,
+        max_depth: int | None = DEFAULT_MAX_DEPTH,
+        ignore_files: tuple[str, ...] = (IGNORE_FILE_NAME,),
+        fast_path: bool = True,
+    ):
+        self.include = [(glob_to_regex(g.strip("/")), "/" in g.strip("/")) for g in include]
+        self.exclude = IgnoreRules().extended(exclude)
+        self.max_depth = max_depth
+        self.ignore_files = ignore_files
+        self.fast_path = fast_path
+        self.depth_skipped = 0
+
+    def find(self, workspace: Path) -> list[Path]:
+        run_dirs: list[Path] = []
+        stats = {"depth_skipped": 0}
+        self._walk(workspace, "", 0, self.exclude, run_dirs, stats)
+        self.depth_skipped = stats["depth_skipped"]
+        if self.include:
+            run_dirs = [d for d in run_dirs if self._included(d.relative_to(workspace).as_posix())]
+        return run_dirs
+
+    def _included(self, rel: str) -> bool:
+        for regex, anchored in self.include:
+            if anchored and regex.match(rel):
+                return True
+            if not anchored and any(regex.match(part) for part in rel.split("/")):
+                return True
+        return False
+
+    def _walk(
+        self, current: Path, rel: str, depth: int, rules: IgnoreRules, run_dirs: list[Path], stats: dict,
+    ) -> None:
+        entries = _scandir_dirs(current)
+        if entries is None:
+            return
+        names = {e.name for e in entries}
+        if "outputs" in names:
+            run_dirs.append(current)
+            return
+        if (current / "pyvenv.cfg").is_file():
+            return
+        for name in self.ignore_files:
+            try:
+                rules = rules.extended((current / name).read_text().splitlines(), rel)
+            except (OSError, UnicodeDecodeError):
+                pass
+        if self.max_depth is not None and depth >= self.max_depth:
+            stats["depth_skipped"] += sum(
+                1 for e in entries
+                if not rules.ignored(f"{rel}/{e.name}" if rel else e.name)
+            )
+            return
+
+        for entry in entries:
+            child_rel = f"{rel}/{entry.name}" if rel else entry.name
+            if rules.ignored(child_rel):
+                continue
+            child = Path(entry.path)
+            # Layout runs sit two levels below the eval dir
+            fits_depth = self.max_depth is None or depth + 3 <= self.max_depth
+            if self.fast_path and fits_depth and entry.name.startswith("eval-"):
+                layout_runs = self._layout_runs(child, child_rel, rules)
+                if layout_runs is not None:
+                    run_dirs.extend(layout_runs)
+                    continue
+            self._walk(child, child_rel, depth + 1, rules, run_dirs, stats)
+
+    def _layout_runs(self, eval_dir: Path, rel: str, rules: IgnoreRules) -> list[Path] | None:
+        """Runs of an eval-*/<config>/[run-*/]outputs directory, or None if it isn't one.
+
+        None unless every (non-ignored) directory in it fits the layout, so
+        that nothing the full walk would find is left out.
+        """
+        configs = _scandir_dirs(eval_dir)
+        if not configs or any(e.name == "outputs" for e in configs) or self._walk_needed(eval_dir):
+            return None
+        runs: list[Path] = []
+        for config in configs:
+            config_rel = f"{rel}/{config.name}"
+            if rules.ignored(config_rel):
+                continue
+            children = _scandir_dirs(Path(config.path))
+            if children is None:
+                return None
+            if any(e.name == "outputs" for e in children):
+                runs.append(Path(config.path))
+                continue
+            if self._walk_needed(Path(config.path)):
+                return None
+            for run in children:
+                if rules.ignored(f"{config_rel}/{run.name}"):
+                    continue
+                if not run.name.startswith("run-") or not (Path(run.path) / "outputs").is_dir():
+                    return None
+                runs.append(Path(run.path))
+        return runs or None
+
+    def _walk_needed(self, path: Path) -> bool:
+        """Whether path has an ignore file or is a virtualenv, which only the walk handles."""
+        return any((path / name).exists() for name in (*self.ignore_files, "pyvenv.cfg"))
+
+
+def _scandir_dirs(path: Path) -> list[os.DirEntry] | None:
+    """Subdirectories of path sorted by name, or None if it can't be listed."""
+    try:
+        with os.scandir(path) as it:
+            return sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    except OSError:
+        return None
 
-    outputs_dir = current / "outputs"
-    if outputs_dir.is_dir():
-        run = build_run(root, current)
-        if run:
-            runs.append(run)
-        return
 
-    skip = {"node_modules", ".git", "__pycache__", "skill", "inputs"}
-    for child in sorted(current.iterdir()):
-        if child.is_dir() and child.name not in skip:
-            _find_runs_recursive(root, child, runs)
+def run_id_for(root: Path, run_dir: Path) -> str:
+    return str(run_dir.relative_to(root)).replace("/", "-").replace("\\", "-")
 
 
-def build_run(root: Path, run_dir: Path) -> dict | None:
-    """Build a run dict with prompt, outputs, and grading data."""
+def list_output_files(run_dir: Path) -> list[Path]:
+    """Output files of a run, excluding metadata files, in display order."""
+    outputs_dir = run_dir / "outputs"
+    if not outputs_dir.is_dir():
+        return []
+    return [
+        f for f in sorted(outputs_dir.iterdir())
+        if f.is_file() and f.name not in METADATA_FILES
+    ]
+
+
+def build_run(root: Path, run_dir: Path, embed_outputs: bool = True) -> dict | None:
+    """Build a run dict with prompt, outputs, and grading data.
+
+    With embed_outputs=False, outputs are {"name", "type"} stubs and file
+    contents are not read.
+    """
     prompt = ""
     eval_id = None
 
@@ -116,15 +457,13 @@ def build_run(root: Path, run_dir: Path) -> dict | None:
     if not prompt:
         prompt = "(No prompt found)"
 
-    run_id = str(run_dir.relative_to(root)).replace("/", "-").replace("\\", "-")
+    run_id = run_id_for(root, run_dir)
 
     # Collect output files
-    outputs_dir = run_dir / "outputs"
-    output_files: list[dict] = []
-    if outputs_dir.is_dir():
-        for f in sorted(outputs_dir.iterdir()):
-            if f.is_file() and f.name not in METADATA_FILES:
-                output_files.append(embed_file(f))
+    if embed_outputs:
+        output_files = [embed_file(f) for f in list_output_files(run_dir)]
+    else:
+        output_files = [output_stub(f) for f in list_output_files(run_dir)]
 
     # Load grading if present
     grading = None
@@ -146,11 +485,191 @@ def build_run(root: Path, run_dir: Path) -> dict | None:
     }
 
 
-def embed_file(path: Path) -> dict:
-    """Read a file and return an embedded representation."""
+def output_type(path: Path) -> str:
+    """Viewer render type for an output file (text, image, pdf, xlsx, binary)."""
+    ext = path.suffix.lower()
+    if ext in TEXT_EXTENSIONS:
+        return "text"
+    if ext in IMAGE_EXTENSIONS:
+        return "image"
+    if ext == ".pdf":
+        return "pdf"
+    if ext == ".xlsx":
+        return "xlsx"
+    return "binary"
+
+
+def output_stub(path: Path) -> dict:
+    """Placeholder for an output whose content the viewer loads on demand."""
+    return {"name": path.name, "type": output_type(path)}
+
+
+def file_url(run_id: str, name: str, previous: bool = False) -> str:
+    """URL under which the review server streams a run's output file."""
+    prefix = "/files-previous" if previous else "/files"
+    return f"{prefix}/{quote(run_id, safe='')}/{quote(name, safe='')}"
+
+
+class EmbedBudget:
+    """Limits on how many bytes of output data one page inlines.
+
+    max_file_bytes caps a single file and max_page_bytes the page total;
+    None disables a limit. Sizes are counted as embedded, i.e. after base64
+    encoding for binary files. Use one budget per page (fresh() makes a new
+    one with the same limits).
+    """
+
+    def __init__(
+        self,
+        max_file_bytes: int | None = DEFAULT_MAX_INLINE_FILE,
+        max_page_bytes: int | None = DEFAULT_MAX_INLINE_PAGE,
+    ):
+        self.max_file_bytes = max_file_bytes
+        self.max_page_bytes = max_page_bytes
+        self.used = 0
+
+    def fresh(self) -> "EmbedBudget":
+        return EmbedBudget(self.max_file_bytes, self.max_page_bytes)
+
+    def reserve(self, nbytes: int) -> bool:
+        """Account for nbytes of inline data, or return False if over budget."""
+        if self.max_file_bytes is not None and nbytes > self.max_file_bytes:
+            return False
+        if self.max_page_bytes is not None and self.used + nbytes > self.max_page_bytes:
+            return False
+        self.used += nbytes
+        return True
+
+    @property
+    def text_preview_bytes(self) -> int:
+        if self.max_file_bytes is None:
+            return TEXT_PREVIEW_BYTES
+        return min(TEXT_PREVIEW_BYTES, self.max_file_bytes)
+
+
+def _b64_size(nbytes: int) -> int:
+    return 4 * ((nbytes + 2) // 3)
+
+
+def text_preview(path: Path, size: int, preview_bytes: int) -> str:
+    """Head and tail of a large text file, cut at line boundaries."""
+    half = preview_bytes // 2
+    with open(path, "rb") as f:
+        head = f.read(half)
+        f.seek(max(size - half, len(head)))
+        tail = f.read(half)
+    if b"\n" in head:
+        head = head[:head.rindex(b"\n") + 1]
+    if b"\n" in tail:
+        tail = tail[tail.index(b"\n") + 1:]
+    omitted = size - len(head) - len(tail)
+    return (
+        head.decode(errors="replace")
+        + f"\n[... {omitted:,} bytes omitted ...]\n\n"
+        + tail.decode(errors="replace")
+    )
+
+
+def make_thumbnail(path: Path) -> tuple[str, bytes] | None:
+    """Down-sampled (mime, bytes) copy of an image, or None without Pillow."""
+    if Image is None:
+        return None
+    try:
+        with Image.open(path) as img:
+            img.thumbnail((THUMBNAIL_PX, THUMBNAIL_PX))
+            buf = io.BytesIO()
+            if img.mode in ("RGBA", "LA", "P"):
+                img.save(buf, "PNG", optimize=True)
+                return "image/png", buf.getvalue()
+            img.convert("RGB").save(buf, "JPEG", quality=85)
+            return "image/jpeg", buf.getvalue()
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+def limit_embed(path: Path, budget: EmbedBudget | None, link: str) -> dict | None:
+    """Apply budget to an output file before it is inlined.
+
+    Returns None when the whole file fits (its size is then reserved).
+    Otherwise returns the replacement entry: a head/tail preview for text,
+    a thumbnail for images when Pillow is available, or a link-only
+    binary entry. Replacements carry the original "size" and a "link" to
+    the full file.
+    """
+    if budget is None:
+        return None
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return None  # Let the reader report the error
+    ext = path.suffix.lower()
+    is_text = ext in TEXT_EXTENSIONS
+    if budget.reserve(size if is_text else _b64_size(size)):
+        return None
+
+    if is_text:
+        preview_bytes = budget.text_preview_bytes
+        if budget.reserve(preview_bytes):
+            try:
+                content = text_preview(path, size, preview_bytes)
+            except OSError:
+                return {"name": path.name, "type": "error", "content": "(Error reading file)"}
+            return {
+                "name": path.name,
+                "type": "text",
+                "content": content,
+                "truncated": True,
+                "size": size,
+                "link": link,
+            }
+    elif ext in IMAGE_EXTENSIONS:
+        thumb = make_thumbnail(path)
+        if thumb and budget.reserve(_b64_size(len(thumb[1]))):
+            mime, raw = thumb
+            return {
+                "name": path.name,
+                "type": "image",
+                "mime": mime,
+                "data_uri": f"data:{mime};base64,{base64.b64encode(raw).decode('ascii')}",
+                "thumbnail": True,
+                "size": size,
+                "link": link,
+            }
+
+    return {
+        "name": path.name,
+        "type": "binary",
+        "mime": get_mime_type(path),
+        "url": link,
+        "omitted": True,
+        "size": size,
+        "link": link,
+    }
+
+
+def embed_file(path: Path, url: str | None = None, budget: EmbedBudget | None = None) -> dict:
+    """Read a file and return an embedded representation.
+
+    If url is given, non-text files are referenced by that URL instead of
+    being read and base64-encoded; text is always inlined. With a budget,
+    files that don't fit are previewed or linked instead (see limit_embed);
+    the link is url, or a file:// URI when there is none.
+    """
     ext = path.suffix.lower()
     mime = get_mime_type(path)
 
+    if url and ext not in TEXT_EXTENSIONS:
+        return {
+            "name": path.name,
+            "type": output_type(path),
+            "mime": mime,
+            "url": url,
+        }
+
+    limited = limit_embed(path, budget, url or path.resolve().as_uri())
+    if limited is not None:
+        return limited
+
     if ext in TEXT_EXTENSIONS:
         try:
             content = path.read_text(errors="replace")
@@ -210,29 +729,183 @@ def embed_file(path: Path) -> dict:
         }
 
 
-def load_previous_iteration(workspace: Path) -> dict[str, dict]:
+def read_feedback(feedback_path: Path) -> dict:
+    """Read feedback.json and replay any feedback.log.jsonl deltas on top.
+
+    Log lines are {"run_id", "feedback", "timestamp"} objects; later lines
+    win. A torn final line from an interrupted write is ignored. Returns a
+    feedback.json-shaped dict ({"reviews": [...], "status": ...}); any log
+    entry means review resumed, so status becomes "in_progress".
+    """
+    data: dict = {}
+    if feedback_path.exists():
+        try:
+            data = json.loads(feedback_path.read_text())
+        except (json.JSONDecodeError, OSError):
+            data = {}
+    if not isinstance(data, dict):
+        data = {}
+    snapshot_reviews = data.get("reviews", [])
+    if not isinstance(snapshot_reviews, list):
+        snapshot_reviews = []
+    reviews = {r["run_id"]: r for r in snapshot_reviews if isinstance(r, dict) and isinstance(r.get("run_id"), str)}
+
+    log_path = feedback_path.with_name(FEEDBACK_LOG_NAME)
+    try:
+        with open(log_path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    reviews[entry["run_id"]] = {
+                        "run_id": entry["run_id"],
+                        "feedback": entry["feedback"],
+                        "timestamp": entry.get("timestamp", ""),
+                    }
+                    data["status"] = "in_progress"
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+    except OSError:
+        pass
+
+    return {**data, "reviews": list(reviews.values())}
+
+
+class FeedbackLog:
+    """Append-only per-run feedback log with batched fsync and compaction.
+
+    Autosaves append one small JSON line to feedback.log.jsonl instead of
+    rewriting feedback.json, so each keystroke costs O(1) I/O. Lines are
+    flushed immediately and fsync'd every fsync_every appends or after
+    fsync_interval seconds, whichever comes first. Once compact_after lines
+    have accumulated, the log is folded into an atomically written
+    feedback.json snapshot and truncated; replaying the log onto a snapshot
+    is idempotent, so a crash between the two steps loses nothing.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Path,
+        fsync_every: int = 16,
+        fsync_interval: float = 1.0,
+        compact_after: int = 200,
+    ):
+        self.snapshot_path = snapshot_path
+        self.log_path = snapshot_path.with_name(FEEDBACK_LOG_NAME)
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.compact_after = compact_after
+        self._lock = threading.Lock()
+        self._file = None
+        self._lines = 0
+        self._unsynced = 0
+        self._timer: threading.Timer | None = None
+        # Entries left by an earlier session count towards compact_after;
+        # from here on self._lines tracks the file
+        try:
+            with open(self.log_path, "rb") as fh:
+                self._lines = sum(1 for _ in fh)
+        except OSError:
+            pass
+
+    def append(self, run_id: str, feedback: str, timestamp: str = "") -> None:
+        line = json.dumps({"run_id": run_id, "feedback": feedback, "timestamp": timestamp}) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.log_path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            self._lines += 1
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                self._sync()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.fsync_interval, self._sync_locked)
+                self._timer.daemon = True
+                self._timer.start()
+            if self._lines >= self.compact_after:
+                self._compact()
+
+    def read(self) -> dict:
+        with self._lock:
+            return read_feedback(self.snapshot_path)
+
+    def write_snapshot(self, data: dict) -> None:
+        """Replace the feedback with a full snapshot (e.g. the final submit)."""
+        with self._lock:
+            write_json_atomic(self.snapshot_path, data)
+            self._truncate_log()
+
+    def compact(self) -> None:
+        with self._lock:
+            self._compact()
+
+    def close(self) -> None:
+        """Fold any outstanding log entries into feedback.json."""
+        self.compact()
+
+    def _sync_locked(self) -> None:
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._file is not None and self._unsynced:
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def _compact(self) -> None:
+        if not self.log_path.exists():
+            return
+        self._sync()
+        write_json_atomic(self.snapshot_path, read_feedback(self.snapshot_path))
+        self._truncate_log()
+
+    def _truncate_log(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.log_path.unlink(missing_ok=True)
+        self._lines = 0
+        self._unsynced = 0
+
+
+def write_json_atomic(path: Path, data: object) -> None:
+    """Write JSON via a temp file + rename so readers never see a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        f.write(json.dumps(data, indent=2) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_previous_iteration(
+    workspace: Path, embed_outputs: bool = True, discovery: "RunDiscovery | None" = None,
+) -> dict[str, dict]:
     """Load previous iteration's feedback and outputs.
 
     Returns a map of run_id -> {"feedback": str, "outputs": list[dict]}.
+    With embed_outputs=False the outputs are stubs (see build_run).
     """
     result: dict[str, dict] = {}
 
-    # Load feedback
+    # Load feedback (snapshot plus any uncompacted log entries)
     feedback_map: dict[str, str] = {}
-    feedback_path = workspace / "feedback.json"
-    if feedback_path.exists():
+    for r in read_feedback(workspace / "feedback.json")["reviews"]:
+        # Skip malformed entries one at a time rather than losing them all
         try:
-            data = json.loads(feedback_path.read_text())
-            feedback_map = {
-                r["run_id"]: r["feedback"]
-                for r in data.get("reviews", [])
-                if r.get("feedback", "").strip()
-            }
-        except (json.JSONDecodeError, OSError, KeyError):
-            pass
+            if r.get("feedback", "").strip():
+                feedback_map[r["run_id"]] = r["feedback"]
+        except (KeyError, AttributeError, TypeError):
+            continue
 
     # Load runs (to get outputs)
-    prev_runs = find_runs(workspace)
+    prev_runs = find_runs(workspace, embed_outputs=embed_outputs, discovery=discovery)
     for run in prev_runs:
         result[run["id"]] = {
             "feedback": feedback_map.get(run["id"], ""),
@@ -252,10 +925,16 @@ def generate_html(
     skill_name: str,
     previous: dict[str, dict] | None = None,
     benchmark: dict | None = None,
+    lazy: bool = False,
+    generation: int | None = None,
 ) -> str:
-    """Generate the complete standalone HTML page with embedded data."""
-    template_path = Path(__file__).parent / "viewer.html"
-    template = template_path.read_text()
+    """Generate the complete standalone HTML page with embedded data.
+
+    With lazy=True the runs carry output stubs and the viewer fetches the
+    contents from the server's /api/runs/<run_id> endpoint. A generation
+    makes the viewer subscribe to /api/events for changes after it.
+    """
+    template = load_template()
 
     # Build previous_feedback and previous_outputs maps for the template
     previous_feedback: dict[str, str] = {}
@@ -275,10 +954,664 @@ def generate_html(
     }
     if benchmark:
         embedded["benchmark"] = benchmark
+    if lazy:
+        embedded["lazy"] = True
+    if generation is not None:
+        embedded["generation"] = generation
 
     data_json = json.dumps(embedded)
 
-    return template.replace("/*__EMBEDDED_DATA__*/", f"const EMBEDDED_DATA = {data_json};")
+    return template.replace(EMBEDDED_DATA_MARKER, f"const EMBEDDED_DATA = {data_json};")
+
+
+def load_template() -> str:
+    return (Path(__file__).parent / "viewer.html").read_text()
+
+
+# ---------------------------------------------------------------------------
+# Diffs against the previous iteration
+# ---------------------------------------------------------------------------
+
+def content_hash(path: Path) -> str | None:
+    """Blob key of an output file: sha256 over its extension and bytes.
+
+    The extension is included because it decides how the file is embedded
+    and rendered. Returns None if the file can't be read.
+    """
+    digest = hashlib.sha256(path.suffix.lower().encode() + b"\0")
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(FILE_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def diff_pairs(run_dir: Path, previous_run_dir: Path | None) -> list[tuple[Path, Path]]:
+    """(current, previous) text outputs of a run that exist in both iterations."""
+    if previous_run_dir is None:
+        return []
+    pairs = []
+    for path in list_output_files(run_dir):
+        if path.suffix.lower() not in TEXT_EXTENSIONS:
+            continue
+        previous_path = previous_run_dir / "outputs" / path.name
+        if previous_path.is_file():
+            pairs.append((path, previous_path))
+    return pairs
+
+
+def text_diff(current_path: str, previous_path: str) -> dict:
+    """Unified diff from the previous to the current version of a text file.
+
+    Runs in a worker process, so it takes and returns plain data. Files over
+    MAX_DIFF_BYTES and diffs over MAX_DIFF_LINES are cut short.
+    """
+    texts = []
+    for path in (previous_path, current_path):
+        with open(path, "rb") as f:
+            texts.append(f.read(MAX_DIFF_BYTES).decode(errors="replace").splitlines())
+    lines = list(difflib.unified_diff(
+        texts[0], texts[1], "previous", "current", n=DIFF_CONTEXT, lineterm="",
+    ))
+    added = sum(1 for line in lines[2:] if line.startswith("+"))
+    removed = sum(1 for line in lines[2:] if line.startswith("-"))
+    result = {"diff": "\n".join(lines[:MAX_DIFF_LINES]), "added": added, "removed": removed}
+    if len(lines) > MAX_DIFF_LINES:
+        result["truncated"] = True
+    return result
+
+
+class DiffCache:
+    """Diffs of text outputs against the previous iteration.
+
+    Results are cached by the content hashes of both files, so a diff is
+    computed once however many runs or page loads need it; file hashes are
+    in turn cached by stat stamp. Misses are computed in a process pool
+    (difflib is pure Python and CPU-bound). Thread-safe.
+
+    A diff that fails in its worker is shown as no diff rather than failing
+    the page or export. If the pool breaks (a worker died), its pending
+    diffs are dropped, not cached, and the next call starts a fresh pool.
+
+    Both caches are LRU-bounded (max_diffs, max_hashes), so a long-running
+    server whose outputs keep changing doesn't grow without limit.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_diffs: int = MAX_CACHED_DIFFS,
+        max_hashes: int = MAX_CACHED_HASHES,
+    ):
+        self.workers = workers
+        self.max_diffs = max_diffs
+        self.max_hashes = max_hashes
+        self._diffs: OrderedDict[tuple[str, str], dict | None] = OrderedDict()
+        self._hashes: OrderedDict[Path, tuple[tuple[int, int] | None, str | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pool: ProcessPoolExecutor | None = None
+
+    @staticmethod
+    def _remember(cache: OrderedDict, key, value, limit: int) -> None:
+        """Store key as most recently used, evicting the oldest entries over limit; call with the lock held."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def file_hash(self, path: Path) -> str | None:
+        """content_hash(path), reused while the file's stat stamp is unchanged."""
+        stamp = _stamp(path)
+        with self._lock:
+            cached = self._hashes.get(path)
+            if cached and cached[0] == stamp:
+                self._hashes.move_to_end(path)
+                return cached[1]
+        digest = content_hash(path)
+        with self._lock:
+            self._remember(self._hashes, path, (stamp, digest), self.max_hashes)
+        return digest
+
+    def diffs(self, pairs: list[tuple[Path, Path]]) -> list[dict | None]:
+        """Diff entries ({"name", "diff", "added", "removed"}) aligned with pairs.
+
+        Entries are None for pairs that are unreadable or identical.
+        """
+        keys = [(self.file_hash(current), self.file_hash(previous)) for current, previous in pairs]
+        # Collected here rather than re-read from self._diffs, which may
+        # evict entries before this call is done with them
+        found: dict[tuple[str, str], dict | None] = {}
+        pending = {}
+        with self._lock:
+            for (current, previous), key in zip(pairs, keys):
+                if None in key or key[0] == key[1] or key in found or key in pending:
+                    continue
+                if key in self._diffs:
+                    self._diffs.move_to_end(key)
+                    found[key] = self._diffs[key]
+                    continue
+                submitted = self._submit(str(current), str(previous))
+                if submitted:
+                    pending[key] = submitted
+        for key, (pool, future) in pending.items():
+            try:
+                diff = future.result()
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+                continue
+            except OSError:
+                continue
+            except Exception:
+                # Same content always fails the same way: remember it as no diff
+                diff = None
+            found[key] = diff
+            with self._lock:
+                self._remember(self._diffs, key, diff, self.max_diffs)
+
+        results = []
+        for (current, _), key in zip(pairs, keys):
+            diff = found.get(key)
+            results.append({"name": current.name, **diff} if diff else None)
+        return results
+
+    def _submit(self, current: str, previous: str) -> tuple[ProcessPoolExecutor, object] | None:
+        """Queue text_diff on the pool, (re)starting it as needed; call with the lock held.
+
+        None if a fresh pool breaks straight away too.
+        """
+        for attempt in range(2):
+            if self._pool is None:
+                # spawn, not fork: the review server is multi-threaded
+                self._pool = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context("spawn"),
+                )
+            try:
+                return self._pool, self._pool.submit(text_diff, current, previous)
+            except BrokenProcessPool:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+        return None
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def run_diffs(self, run_dir: Path, previous_run_dir: Path | None) -> list[dict]:
+        return [d for d in self.diffs(diff_pairs(run_dir, previous_run_dir)) if d]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+
+# ---------------------------------------------------------------------------
+# Streaming static export
+# ---------------------------------------------------------------------------
+
+def write_static_html(
+    out_path: Path,
+    workspace: Path,
+    skill_name: str,
+    previous_workspace: Path | None = None,
+    benchmark: dict | None = None,
+    budget: EmbedBudget | None = None,
+    diff_cache: DiffCache | None = None,
+    discovery: RunDiscovery | None = None,
+) -> None:
+    """Write the self-contained viewer for --static straight to out_path.
+
+    Produces the same page as generate_html() over fully embedded runs, but
+    writes the template prefix, then each run and each output file as it
+    is read (binary files base64-encoded chunk by chunk), then the suffix.
+
+    Outputs are content-addressed: each run lists {"name", "blob"} refs and
+    every distinct file is embedded once in a trailing "blobs" map keyed by
+    content_hash(), so files shared between runs or with the previous
+    iteration cost nothing extra. The budget is charged per blob. With a
+    previous workspace and a diff_cache, each run also carries "diffs" of its
+    text outputs against the previous iteration, computed up front.
+
+    Peak memory is roughly one text file or one read chunk rather than the
+    whole workspace. The page is written to a temp file and renamed into
+    place, so an interrupted export never leaves a truncated viewer behind.
+    """
+    prefix, _, suffix = load_template().partition(EMBEDDED_DATA_MARKER)
+
+    previous_feedback: dict[str, str] = {}
+    previous_dirs: list[tuple[str, Path]] = []
+    if previous_workspace:
+        previous = load_previous_iteration(previous_workspace, embed_outputs=False, discovery=discovery)
+        previous_feedback = {
+            run_id: data["feedback"] for run_id, data in previous.items() if data.get("feedback")
+        }
+        previous_dirs = [
+            (run_id_for(previous_workspace, run_dir), run_dir)
+            for run_dir in find_run_dirs(previous_workspace, discovery)
+        ]
+
+    runs = _static_runs(workspace, discovery)
+    diffs: dict[str, list[dict]] = {}
+    if previous_dirs and diff_cache:
+        previous_by_id = dict(previous_dirs)
+        pairs = {run["id"]: diff_pairs(run_dir, previous_by_id.get(run["id"])) for run, run_dir in runs}
+        # One batch, so the pool works across runs
+        flat = [pair for run_pairs in pairs.values() for pair in run_pairs]
+        results = iter(diff_cache.diffs(flat))
+        for run_id, run_pairs in pairs.items():
+            run_diffs = [d for d in (next(results) for _ in run_pairs) if d]
+            if run_diffs:
+                diffs[run_id] = run_diffs
+    hash_file = diff_cache.file_hash if diff_cache else content_hash
+
+    blobs: dict[str, Path] = {}  # content hash -> first file with that content
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(prefix)
+        f.write("const EMBEDDED_DATA = {")
+        f.write(f'"skill_name": {json.dumps(skill_name)}, "runs": [')
+        for i, (run, run_dir) in enumerate(runs):
+            if i:
+                f.write(", ")
+            # The stub outputs are replaced by the streamed contents
+            run = {k: v for k, v in run.items() if k != "outputs"}
+            if run["id"] in diffs:
+                run["diffs"] = diffs[run["id"]]
+            f.write(json.dumps(run)[:-1] + ', "outputs": ')
+            _write_output_refs(f, list_output_files(run_dir), blobs, hash_file)
+            f.write("}")
+        f.write(f'], "previous_feedback": {json.dumps(previous_feedback)}, "previous_outputs": {{')
+        first = True
+        for run_id, run_dir in previous_dirs:
+            files = list_output_files(run_dir)
+            if not files:
+                continue
+            if not first:
+                f.write(", ")
+            first = False
+            f.write(f"{json.dumps(run_id)}: ")
+            _write_output_refs(f, files, blobs, hash_file)
+        f.write('}, "blobs": {')
+        for i, (key, path) in enumerate(blobs.items()):
+            if i:
+                f.write(", ")
+            f.write(f"{json.dumps(key)}: ")
+            _stream_embedded_file(f, path, budget)
+        f.write("}")
+        if benchmark:
+            f.write(f', "benchmark": {json.dumps(benchmark)}')
+        f.write("};")
+        f.write(suffix)
+    os.replace(tmp_path, out_path)
+
+
+def _static_runs(workspace: Path, discovery: RunDiscovery | None) -> list[tuple[dict, Path]]:
+    """(run stub, run dir) pairs in find_runs() order, without file contents."""
+    runs = []
+    for run_dir in find_run_dirs(workspace, discovery):
+        run = build_run(workspace, run_dir, embed_outputs=False)
+        if run:
+            runs.append((run, run_dir))
+    runs.sort(key=lambda pair: (pair[0].get("eval_id", float("inf")), pair[0]["id"]))
+    return runs
+
+
+def _write_output_refs(f, files: list[Path], blobs: dict[str, Path], hash_file) -> None:
+    """Write a run's outputs as blob refs, registering unseen blobs."""
+    refs = []
+    for path in files:
+        key = hash_file(path)
+        if key is None:
+            refs.append({"name": path.name, "type": "error", "content": "(Error reading file)"})
+            continue
+        blobs.setdefault(key, path)
+        refs.append({"name": path.name, "blob": key})
+    f.write(json.dumps(refs))
+
+
+def _stream_embedded_file(f, path: Path, budget: EmbedBudget | None) -> None:
+    """Write embed_file(path) as JSON to f, base64-encoding binaries in chunks."""
+    ext = path.suffix.lower()
+    if ext in TEXT_EXTENSIONS:
+        f.write(json.dumps(embed_file(path, budget=budget)))
+        return
+
+    limited = limit_embed(path, budget, path.resolve().as_uri())
+    if limited is not None:
+        f.write(json.dumps(limited))
+        return
+
+    try:
+        src = open(path, "rb")
+    except OSError:
+        f.write(json.dumps({"name": path.name, "type": "error", "content": "(Error reading file)"}))
+        return
+
+    mime = get_mime_type(path)
+    kind = output_type(path)
+    head = {"name": path.name, "type": kind}
+    if kind in ("image", "binary"):
+        head["mime"] = mime
+    if kind == "xlsx":
+        field, data_prefix = "data_b64", ""
+    else:
+        field, data_prefix = "data_uri", f"data:{mime};base64,"
+
+    # Base64 output needs no JSON escaping, so it is written between the quotes as-is
+    f.write(json.dumps(head)[:-1] + f', "{field}": "{data_prefix}')
+    with src:
+        try:
+            while chunk := src.read(B64_CHUNK_SIZE):
+                f.write(base64.b64encode(chunk).decode("ascii"))
+        except OSError:
+            pass
+    f.write('"}')
+
+
+# ---------------------------------------------------------------------------
+# Run cache (reuses built runs while their files are unchanged)
+# ---------------------------------------------------------------------------
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def run_signature(run_dir: Path) -> tuple:
+    """Stat-only fingerprint of everything build_run and embed_file read.
+
+    Covers the metadata, transcript and grading candidates plus the name,
+    mtime and size of every output file, so any edit, addition or removal
+    changes the signature without reading file contents.
+    """
+    sources = (
+        run_dir / "eval_metadata.json", run_dir.parent / "eval_metadata.json",
+        run_dir / "transcript.md", run_dir / "outputs" / "transcript.md",
+        run_dir / "grading.json", run_dir.parent / "grading.json",
+    )
+    outputs: list[tuple] = []
+    try:
+        with os.scandir(run_dir / "outputs") as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                outputs.append((entry.name, st.st_mtime_ns, st.st_size))
+    except OSError:
+        pass
+    return tuple(_stamp(path) for path in sources) + tuple(sorted(outputs))
+
+
+class RunCache:
+    """Caches built runs for a workspace, keyed by run directory and signature.
+
+    Each scan is a stat walk: runs whose run_signature is unchanged are
+    reused, so refreshing a large workspace does not re-read every output.
+    Scans are rate-limited by polling: within rescan_interval seconds of the
+    last scan the previous result is returned without touching the disk.
+
+    Every scan that adds, changes or removes a run bumps `generation`, and
+    each run remembers the generation it last changed in, so clients can ask
+    for just the changes since the generation they already have.
+    """
+
+    def __init__(
+        self,
+        workspace: Path,
+        previous: bool = False,
+        rescan_interval: float = 1.0,
+        budget: EmbedBudget | None = None,
+        discovery: RunDiscovery | None = None,
+    ):
+        self.workspace = workspace
+        self.discovery = discovery
+        self.previous = previous
+        self.rescan_interval = rescan_interval
+        self.budget = budget  # Applied per run payload
+        # run_dir -> {"signature", "run" (index entry with stubs), "outputs" (lazily built)}
+        self._entries: dict[Path, dict] = {}
+        self._by_id: dict[str, Path] = {}
+        self._runs: list[dict] = []
+        self._version = ""
+        self._last_scan = 0.0
+        self._generation = 0
+        self._removed: dict[str, int] = {}  # run_id -> generation it disappeared in
+        # Request threads share the cache; one scan at a time
+        self._lock = threading.RLock()
+
+    def runs(self) -> list[dict]:
+        """Return the run index (outputs as stubs), rescanning if due."""
+        with self._lock:
+            return self._scan()
+
+    def _scan(self) -> list[dict]:
+        now = time.monotonic()
+        if self._last_scan and now - self._last_scan < self.rescan_interval:
+            return self._runs
+
+        generation = self._generation + 1
+        changed = False
+        entries: dict[Path, dict] = {}
+        for run_dir in find_run_dirs(self.workspace, self.discovery):
+            signature = run_signature(run_dir)
+            entry = self._entries.get(run_dir)
+            if entry is None or entry["signature"] != signature:
+                run = build_run(self.workspace, run_dir, embed_outputs=False)
+                if not run:
+                    continue
+                entry = {"signature": signature, "run": run, "outputs": None, "generation": generation}
+                changed = True
+            entries[run_dir] = entry
+
+        by_id = {entry["run"]["id"]: run_dir for run_dir, entry in entries.items()}
+        for run_id in self._by_id.keys() - by_id.keys():
+            self._removed[run_id] = generation
+            changed = True
+        for run_id in by_id.keys() & self._removed.keys():
+            del self._removed[run_id]
+        if changed:
+            self._generation = generation
+
+        self._entries = entries
+        self._by_id = by_id
+        self._runs = sorted(
+            (entry["run"] for entry in entries.values()),
+            key=lambda r: (r.get("eval_id", float("inf")), r["id"]),
+        )
+        self._version = hashlib.sha256(
+            repr(sorted((str(d), e["signature"]) for d, e in entries.items())).encode()
+        ).hexdigest()[:20]
+        self._last_scan = time.monotonic()
+        return self._runs
+
+    def generation(self) -> int:
+        with self._lock:
+            self._scan()
+            return self._generation
+
+    def changes_since(self, since: int) -> dict:
+        """Runs added/changed and run ids removed after generation `since`.
+
+        Also returns the full run order so clients can place new runs. A
+        `since` ahead of this cache (a client of an earlier server process)
+        is treated as 0, i.e. a full resync.
+        """
+        with self._lock:
+            runs = self._scan()
+            if since > self._generation:
+                since = 0
+            return {
+                "generation": self._generation,
+                "order": [r["id"] for r in runs],
+                "runs": [e["run"] for e in self._entries.values() if e["generation"] > since],
+                "removed": [run_id for run_id, gen in self._removed.items() if gen > since],
+            }
+
+    def version(self) -> str:
+        """Hash of every run's signature; changes whenever any run changes."""
+        with self._lock:
+            self._scan()
+            return self._version
+
+    def run_dir(self, run_id: str) -> Path | None:
+        with self._lock:
+            self._scan()
+            return self._by_id.get(run_id)
+
+    def outputs(self, run_id: str) -> list[dict] | None:
+        """Embedded outputs for one run (binaries by URL), or None if unknown."""
+        with self._lock:
+            run_dir = self.run_dir(run_id)
+            if run_dir is None:
+                return None
+            entry = self._entries[run_dir]
+            if entry["outputs"] is None:
+                budget = self.budget.fresh() if self.budget else None
+                entry["outputs"] = [
+                    embed_file(f, url=file_url(run_id, f.name, previous=self.previous), budget=budget)
+                    for f in list_output_files(run_dir)
+                ]
+            return entry["outputs"]
+
+
+# ---------------------------------------------------------------------------
+# Full-text search
+# ---------------------------------------------------------------------------
+
+# Wrapped around matched terms in search snippets (the viewer highlights them)
+SNIPPET_OPEN = "\x02"
+SNIPPET_CLOSE = "\x03"
+
+
+class SearchIndex:
+    """Full-text index over run prompts, text outputs and grading evidence.
+
+    Backed by an in-memory SQLite FTS5 table ranked with bm25, or by a plain
+    table searched with LIKE when SQLite was built without FTS5. sync()
+    follows RunCache.changes_since, so only runs added or changed since the
+    last search are (re)indexed and removed runs are dropped. Thread-safe.
+    """
+
+    def __init__(self, run_cache: RunCache):
+        self.run_cache = run_cache
+        self._db = sqlite3.connect(":memory:", check_same_thread=False)
+        self._lock = threading.Lock()
+        self._generation = 0
+        try:
+            self._db.execute(
+                "CREATE VIRTUAL TABLE docs USING fts5("
+                "run_id UNINDEXED, field UNINDEXED, name UNINDEXED, body)"
+            )
+            self.engine = "fts5"
+        except sqlite3.OperationalError:
+            self._db.execute("CREATE TABLE docs (run_id TEXT, field TEXT, name TEXT, body TEXT)")
+            self._db.execute("CREATE INDEX docs_run ON docs (run_id)")
+            self.engine = "like"
+
+    def sync(self) -> None:
+        with self._lock:
+            changes = self.run_cache.changes_since(self._generation)
+            if changes["generation"] == self._generation:
+                return
+            with self._db:
+                for run in changes["runs"]:
+                    self._db.execute("DELETE FROM docs WHERE run_id = ?", (run["id"],))
+                    self._db.executemany(
+                        "INSERT INTO docs (run_id, field, name, body) VALUES (?, ?, ?, ?)",
+                        [(run["id"], *doc) for doc in self._documents(run)],
+                    )
+                for run_id in changes["removed"]:
+                    self._db.execute("DELETE FROM docs WHERE run_id = ?", (run_id,))
+            self._generation = changes["generation"]
+
+    def _documents(self, run: dict) -> list[tuple[str, str, str]]:
+        """(field, name, body) rows for one run."""
+        docs = [("prompt", "", run.get("prompt", ""))]
+        run_dir = self.run_cache.run_dir(run["id"])
+        for path in list_output_files(run_dir) if run_dir else []:
+            if path.suffix.lower() not in TEXT_EXTENSIONS:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    docs.append(("output", path.name, f.read(MAX_INDEX_BYTES).decode(errors="replace")))
+            except OSError:
+                pass
+        grading = run.get("grading") or {}
+        for expectation in grading.get("expectations", []) if isinstance(grading, dict) else []:
+            if isinstance(expectation, dict):
+                text = f"{expectation.get('text', '')}\n{expectation.get('evidence', '')}"
+                docs.append(("grading", "", text))
+        return docs
+
+    def search(self, query: str, limit: int = 20) -> list[dict]:
+        """Best match per run, best runs first: {"run_id", "field", "name", "snippet"}.
+
+        Every word of the query must occur in the matching document; the
+        last word also matches as a prefix, for search-as-you-type.
+        """
+        words = re.findall(r"\w+", query)
+        if not words:
+            return []
+        self.sync()
+        with self._lock:
+            if self.engine == "fts5":
+                match = " ".join(f'"{w}"' for w in words) + "*"
+                rows = self._db.execute(
+                    "SELECT rowid, run_id FROM docs WHERE docs MATCH ? ORDER BY rank LIMIT ?",
+                    (match, limit * 10),
+                ).fetchall()
+            else:
+                where = " AND ".join(["body LIKE ? ESCAPE '\\'"] * len(words))
+                # Words are \w+, so "_" is the only LIKE wildcard they can contain
+                patterns = ["%" + w.replace("_", "\\_") + "%" for w in words]
+                rows = self._db.execute(
+                    f"SELECT rowid, run_id FROM docs WHERE {where} LIMIT ?", (*patterns, limit * 10),
+                ).fetchall()
+
+            # Best document per run, then snippets for just those. Snippets are
+            # cut in Python: FTS5's snippet() re-tokenizes the whole document.
+            best: dict[str, int] = {}
+            for rowid, run_id in rows:
+                if run_id not in best:
+                    best[run_id] = rowid
+                    if len(best) == limit:
+                        break
+            docs = {}
+            if best:
+                marks = ",".join("?" * len(best))
+                docs = {
+                    rowid: (run_id, field, name, body)
+                    for rowid, run_id, field, name, body in self._db.execute(
+                        f"SELECT rowid, run_id, field, name, body FROM docs WHERE rowid IN ({marks})",
+                        tuple(best.values()),
+                    )
+                }
+
+        results = []
+        for rowid in best.values():
+            run_id, field, name, body = docs[rowid]
+            results.append({
+                "run_id": run_id, "field": field, "name": name,
+                "snippet": _like_snippet(body, words),
+            })
+        return results
+
+
+def _like_snippet(body: str, words: list[str], width: int = 60) -> str:
+    """Snippet around the first query word in body, with the words marked."""
+    lower = body.lower()
+    start = min((i for i in (lower.find(w.lower()) for w in words) if i >= 0), default=0)
+    lo, hi = max(0, start - width), min(len(body), start + width)
+    text = ("…" if lo else "") + body[lo:hi] + ("…" if hi < len(body) else "")
+    pattern = re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+    return pattern.sub(lambda m: SNIPPET_OPEN + m.group(0) + SNIPPET_CLOSE, text)
 
 
 # ---------------------------------------------------------------------------
@@ -305,68 +1638,488 @@ def _kill_port(port: int) -> None:
     except FileNotFoundError:
         print("Note: lsof not found, cannot check if port is in use", file=sys.stderr)
 
+
+class ReviewServer(ThreadingHTTPServer):
+    """Threaded HTTP server with a bounded number of requests in flight.
+
+    Each connection gets its own thread so a slow page build doesn't block
+    other reviewers or feedback saves. A request holds one of max_workers
+    slots only while it is being handled; a keep-alive connection waiting
+    for its next request holds none, so idle browser tabs can't stall
+    anyone. Open connections (idle or not) are capped separately at
+    max_connections, beyond which the accept loop waits. Feedback writes
+    are serialized by the FeedbackLog.
+
+    Event streams stay open for as long as a viewer tab does, so they hand
+    back both their slot and their connection (release_stream) and are
+    capped separately at max_streams.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        server_address,
+        handler_class,
+        max_workers: int = 16,
+        max_streams: int = MAX_EVENT_STREAMS,
+        max_connections: int | None = None,
+    ):
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._connections = threading.BoundedSemaphore(max_connections or 8 * max_workers)
+        self.stream_slots = threading.BoundedSemaphore(max_streams)
+        self._held = threading.local()
+        super().__init__(server_address, handler_class)
+
+    def process_request(self, request, client_address) -> None:
+        self._connections.acquire()
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._connections.release()
+            raise
+
+    def process_request_thread(self, request, client_address) -> None:
+        self._held.connection = True
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self.release_slot()
+            self._release_connection()
+
+    def acquire_slot(self) -> None:
+        """Take a worker slot for the request the calling thread is about to handle."""
+        self._slots.acquire()
+        self._held.slot = True
+
+    def release_slot(self) -> None:
+        """Give back the calling thread's worker slot, if it holds one."""
+        if getattr(self._held, "slot", False):
+            self._held.slot = False
+            self._slots.release()
+
+    def release_stream(self) -> None:
+        """Let a long-lived event stream stop counting as a request and a connection."""
+        self.release_slot()
+        self._release_connection()
+
+    def _release_connection(self) -> None:
+        if getattr(self._held, "connection", False):
+            self._held.connection = False
+            self._connections.release()
+
+
 class ReviewHandler(BaseHTTPRequestHandler):
     """Serves the review HTML and handles feedback saves.
 
     Regenerates the HTML on each page load so that refreshing the browser
-    picks up new eval outputs without restarting the server.
+    picks up new eval outputs without restarting the server; the RunCache
+    makes that a stat walk when nothing changed. The page holds only the run
+    index; outputs are served per run:
+
+        GET /api/runs?offset=N&limit=M   page of the run index (output stubs)
+        GET /api/runs/<run_id>           one run's outputs, previous outputs and diffs
+        GET /files/<run_id>/<name>       raw output file (supports Range)
+        GET /files-previous/<run_id>/<name>  same, from the previous workspace
+        GET /api/events?since=G          SSE stream of runs changed after G
+        GET /api/search?q=...&limit=N    ranked full-text search over runs
+        GET /api/feedback                current feedback (snapshot + log)
+        POST /api/feedback               replace all feedback (final submit)
+        POST /api/feedback/<run_id>      append one run's feedback to the log
+
+    Speaks HTTP/1.1 so browsers can reuse connections; idle keep-alive
+    connections hold no worker slot and are closed after `timeout` seconds
+    to free their thread.
     """
 
+    protocol_version = "HTTP/1.1"
+    timeout = 15
+
     def __init__(
         self,
-        workspace: Path,
+        run_cache: RunCache,
         skill_name: str,
-        feedback_path: Path,
+        feedback_log: FeedbackLog,
         previous: dict[str, dict],
         benchmark_path: Path | None,
+        previous_cache: RunCache | None,
+        diff_cache: DiffCache | None,
+        search_index: SearchIndex,
         *args,
         **kwargs,
     ):
-        self.workspace = workspace
+        self.run_cache = run_cache
         self.skill_name = skill_name
-        self.feedback_path = feedback_path
+        self.feedback_log = feedback_log
         self.previous = previous
         self.benchmark_path = benchmark_path
+        self.previous_cache = previous_cache
+        self.diff_cache = diff_cache
+        self.search_index = search_index
         super().__init__(*args, **kwargs)
 
+    def handle_one_request(self) -> None:
+        # Wait for the next request line without a worker slot: peek blocks
+        # (up to `timeout`) until bytes arrive, so idle keep-alive
+        # connections don't count against --max-workers
+        try:
+            if not self.rfile.peek(1):
+                self.close_connection = True
+                return
+        except OSError:  # includes the idle timeout
+            self.close_connection = True
+            return
+        acquire_slot = getattr(self.server, "acquire_slot", None)
+        if acquire_slot is None:
+            super().handle_one_request()
+            return
+        acquire_slot()
+        try:
+            super().handle_one_request()
+        finally:
+            self.server.release_slot()
+
+    def _etag_matches(self, etag: str) -> bool:
+        """True if the request's If-None-Match covers etag."""
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        candidates = [c.strip().removeprefix("W/") for c in header.split(",")]
+        return "*" in candidates or etag in candidates
+
+    def _send_not_modified(self, etag: str) -> None:
+        self.send_response(304)
+        self.send_header("ETag", etag)
+        self.end_headers()
+
+    def _accepted_encoding(self) -> str | None:
+        """The compression _send_body uses for this request: "br", "gzip" or None."""
+        accept = self.headers.get("Accept-Encoding", "")
+        if brotli is not None and "br" in accept:
+            return "br"
+        if "gzip" in accept:
+            return "gzip"
+        return None
+
+    def _encoded_etag(self, etag: str) -> str:
+        """Tag etag with the negotiated encoding, e.g. "abc" -> "abc-gzip".
+
+        Each encoding is a different byte sequence, so it needs its own
+        strong validator; small bodies sent uncompressed keep the tag too.
+        """
+        encoding = self._accepted_encoding()
+        return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+    def _send_body(self, data: bytes, content_type: str, etag: str | None = None) -> None:
+        """Send a 200 response, compressed with br/gzip when the client accepts it.
+
+        etag should come from _encoded_etag so it names the encoding sent.
+        """
+        encoding = self._accepted_encoding() if len(data) >= COMPRESS_MIN_BYTES else None
+        if encoding == "br":
+            data = brotli.compress(data, quality=5)
+        elif encoding == "gzip":
+            data = gzip.compress(data, compresslevel=6)
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("Vary", "Accept-Encoding")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_json(self, obj: object, status: int = 200) -> None:
+        data = json.dumps(obj).encode("utf-8")
+        if status != 200:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+        etag = self._encoded_etag('"' + hashlib.sha256(data).hexdigest()[:20] + '"')
+        if self._etag_matches(etag):
+            self._send_not_modified(etag)
+            return
+        self._send_body(data, "application/json", etag)
+
+    def _page_etag(self) -> str:
+        """ETag for the review page, derived from state rather than content.
+
+        Combines the server instance and run cache version with the
+        benchmark and template stamps, so a matching If-None-Match skips
+        generate_html entirely.
+        """
+        template_path = Path(__file__).parent / "viewer.html"
+        benchmark_stamp = _stamp(self.benchmark_path) if self.benchmark_path else None
+        state = repr((
+            SERVER_INSTANCE, self.run_cache.version(), benchmark_stamp,
+            _stamp(template_path), self.skill_name,
+        ))
+        return self._encoded_etag('"page-' + hashlib.sha256(state.encode()).hexdigest()[:20] + '"')
+
+    def _send_run_page(self, query: dict[str, list[str]]) -> None:
+        try:
+            offset = max(0, int(query.get("offset", ["0"])[0]))
+            limit = max(1, int(query.get("limit", ["100"])[0]))
+        except ValueError:
+            self.send_error(400, "offset and limit must be integers")
+            return
+        runs = self.run_cache.runs()
+        self._send_json({
+            "total": len(runs),
+            "offset": offset,
+            "runs": runs[offset:offset + limit],
+        })
+
+    def _send_search(self, query: dict[str, list[str]]) -> None:
+        try:
+            limit = min(200, max(1, int(query.get("limit", ["20"])[0])))
+        except ValueError:
+            self.send_error(400, "limit must be an integer")
+            return
+        q = query.get("q", [""])[0]
+        start = time.perf_counter()
+        results = self.search_index.search(q, limit)
+        self._send_json({
+            "query": q,
+            "engine": self.search_index.engine,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+            "results": results,
+        })
+
+    def _send_run_outputs(self, run_id: str) -> None:
+        outputs = self.run_cache.outputs(run_id)
+        if outputs is None:
+            self.send_error(404, f"Unknown run: {run_id}")
+            return
+        previous_outputs = None
+        diffs = []
+        if self.previous_cache:
+            previous_outputs = self.previous_cache.outputs(run_id)
+            if self.diff_cache:
+                diffs = self.diff_cache.run_diffs(
+                    self.run_cache.run_dir(run_id), self.previous_cache.run_dir(run_id),
+                )
+        self._send_json({
+            "id": run_id,
+            "outputs": outputs,
+            "previous_outputs": previous_outputs or [],
+            "diffs": diffs,
+        })
+
+    def _send_events(self, query: dict[str, list[str]]) -> None:
+        """Stream run changes as Server-Sent Events until the client goes away.
+
+        Each event carries the changes since the last generation the client
+        saw (from ?since= or, on reconnect, the Last-Event-ID header) and uses
+        the new generation as its id.
+        """
+        try:
+            since = int(self.headers.get("Last-Event-ID") or query.get("since", ["0"])[0])
+        except ValueError:
+            self.send_error(400, "since must be an integer")
+            return
+
+        # The stream is long-lived: trade the connection slot for a stream slot
+        self.close_connection = True
+        release_stream = getattr(self.server, "release_stream", None)
+        stream_slots = getattr(self.server, "stream_slots", None)
+        if release_stream:
+            release_stream()
+        if stream_slots and not stream_slots.acquire(blocking=False):
+            self.send_response(503)
+            self.send_header("Retry-After", str(SSE_HEARTBEAT_SECONDS))
+            self.send_header("Content-Length", "0")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            return
+        try:
+            self._stream_events(since)
+        finally:
+            if stream_slots:
+                stream_slots.release()
+
+    def _stream_events(self, since: int) -> None:
+        if since > self.run_cache.generation():
+            # The client saw an earlier server process: resync from scratch
+            since = 0
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        poll = max(self.run_cache.rescan_interval, 0.5)
+        last_write = time.monotonic()
+        try:
+            while True:
+                changes = self.run_cache.changes_since(since)
+                if changes["generation"] > since:
+                    since = changes["generation"]
+                    payload = json.dumps(changes)
+                    self.wfile.write(f"id: {since}\nevent: runs\ndata: {payload}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+                    last_write = time.monotonic()
+                elif time.monotonic() - last_write >= SSE_HEARTBEAT_SECONDS:
+                    # Comment line: keeps proxies from timing out and detects closed clients
+                    self.wfile.write(b": ping\n\n")
+                    self.wfile.flush()
+                    last_write = time.monotonic()
+                if self._client_closed(poll):
+                    return
+        except (BrokenPipeError, ConnectionResetError):
+            return
+
+    def _client_closed(self, timeout: float) -> bool:
+        """Wait up to timeout; True if the client hung up meanwhile.
+
+        A client never sends anything on an event stream, so the socket
+        turning readable with no data means it closed. Noticing that here
+        frees the stream slot right away rather than at the next heartbeat.
+        """
+        readable, _, _ = select.select([self.connection], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            if not self.connection.recv(1, socket.MSG_PEEK):
+                return True
+        except OSError:
+            return True
+        time.sleep(timeout)
+        return False
+
+    def _send_output_file(self, run_cache: RunCache | None, rest: str) -> None:
+        """Stream one output file from disk, honouring a single Range request."""
+        run_id, _, name = rest.partition("/")
+        run_id, name = unquote(run_id), unquote(name)
+        run_dir = run_cache.run_dir(run_id) if run_cache else None
+        # Only serve files that are listed as outputs; this also rules out path traversal
+        path = None
+        if run_dir is not None:
+            path = next((f for f in list_output_files(run_dir) if f.name == name), None)
+        if path is None:
+            self.send_error(404)
+            return
+
+        try:
+            st = path.stat()
+            size = st.st_size
+            f = open(path, "rb")
+        except OSError:
+            self.send_error(404)
+            return
+
+        etag = f'"{st.st_mtime_ns:x}-{size:x}"'
+        if self._etag_matches(etag):
+            f.close()
+            self._send_not_modified(etag)
+            return
+
+        with f:
+            start, end = 0, size - 1
+            range_header = self.headers.get("Range")
+            match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header.strip()) if range_header else None
+            # Per RFC 9110 an invalid Range (e.g. bytes=5-3) is ignored, not refused;
+            # 416 is only for a valid range this file can't satisfy
+            valid = bool(match and (match.group(1) or match.group(2))) and not (
+                match.group(1) and match.group(2) and int(match.group(1)) > int(match.group(2))
+            )
+            if valid:
+                if match.group(1):
+                    start = int(match.group(1))
+                    if match.group(2):
+                        end = min(int(match.group(2)), size - 1)
+                else:
+                    # Suffix range: the last N bytes
+                    start = max(0, size - int(match.group(2)))
+                if start >= size or start > end:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+            else:
+                self.send_response(200)
+            length = end - start + 1 if size else 0
+            self.send_header("Content-Type", get_mime_type(path))
+            self.send_header("Content-Length", str(length))
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            self.end_headers()
+
+            f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = f.read(min(FILE_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
     def do_GET(self) -> None:
-        if self.path == "/" or self.path == "/index.html":
-            # Regenerate HTML on each request (re-scans workspace for new outputs)
-            runs = find_runs(self.workspace)
+        url = urlsplit(self.path)
+        if url.path == "/" or url.path == "/index.html":
+            # Regenerate HTML on each request (re-scans workspace for new outputs),
+            # unless the browser already holds the page for the current state
+            etag = self._page_etag()
+            if self._etag_matches(etag):
+                self._send_not_modified(etag)
+                return
+            # Read the generation first: a scan in between only means the
+            # client receives a few runs it already has
+            generation = self.run_cache.generation()
+            runs = self.run_cache.runs()
             benchmark = None
             if self.benchmark_path and self.benchmark_path.exists():
                 try:
                     benchmark = json.loads(self.benchmark_path.read_text())
                 except (json.JSONDecodeError, OSError):
                     pass
-            html = generate_html(runs, self.skill_name, self.previous, benchmark)
-            content = html.encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html; charset=utf-8")
-            self.send_header("Content-Length", str(len(content)))
-            self.end_headers()
-            self.wfile.write(content)
-        elif self.path == "/api/feedback":
-            data = b"{}"
-            if self.feedback_path.exists():
-                data = self.feedback_path.read_bytes()
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+            html = generate_html(
+                runs, self.skill_name, self.previous, benchmark,
+                lazy=True, generation=generation,
+            )
+            self._send_body(html.encode("utf-8"), "text/html; charset=utf-8", etag)
+        elif url.path == "/api/runs":
+            self._send_run_page(parse_qs(url.query))
+        elif url.path == "/api/events":
+            self._send_events(parse_qs(url.query))
+        elif url.path == "/api/search":
+            self._send_search(parse_qs(url.query))
+        elif url.path.startswith("/api/runs/"):
+            self._send_run_outputs(unquote(url.path[len("/api/runs/"):]))
+        elif url.path.startswith("/files/"):
+            self._send_output_file(self.run_cache, url.path[len("/files/"):])
+        elif url.path.startswith("/files-previous/"):
+            self._send_output_file(self.previous_cache, url.path[len("/files-previous/"):])
+        elif url.path == "/api/feedback":
+            self._send_json(self.feedback_log.read())
         else:
             self.send_error(404)
 
     def do_POST(self) -> None:
-        if self.path == "/api/feedback":
+        path = urlsplit(self.path).path
+        if path == "/api/feedback" or path.startswith("/api/feedback/"):
             length = int(self.headers.get("Content-Length", 0))
             body = self.rfile.read(length)
             try:
                 data = json.loads(body)
-                if not isinstance(data, dict) or "reviews" not in data:
-                    raise ValueError("Expected JSON object with 'reviews' key")
-                self.feedback_path.write_text(json.dumps(data, indent=2) + "\n")
+                if path == "/api/feedback":
+                    if not isinstance(data, dict) or "reviews" not in data:
+                        raise ValueError("Expected JSON object with 'reviews' key")
+                    self.feedback_log.write_snapshot(data)
+                else:
+                    if not isinstance(data, dict) or not isinstance(data.get("feedback"), str):
+                        raise ValueError("Expected JSON object with a 'feedback' string")
+                    run_id = unquote(path[len("/api/feedback/"):])
+                    self.feedback_log.append(run_id, data["feedback"], str(data.get("timestamp", "")))
                 resp = b'{"ok":true}'
                 self.send_response(200)
             except (json.JSONDecodeError, OSError, ValueError) as e:
@@ -389,6 +2142,10 @@ def main() -> None:
     parser.add_argument("workspace", type=Path, help="Path to workspace directory")
     parser.add_argument("--port", "-p", type=int, default=3117, help="Server port (default: 3117)")
     parser.add_argument("--skill-name", "-n", type=str, default=None, help="Skill name for header")
+    parser.add_argument(
+        "--max-workers", type=int, default=16,
+        help="Maximum concurrently served connections (default: 16)",
+    )
     parser.add_argument(
         "--previous-workspace", type=Path, default=None,
         help="Path to previous iteration's workspace (shows old outputs and feedback as context)",
@@ -401,6 +2158,33 @@ def main() -> None:
         "--static", "-s", type=Path, default=None,
         help="Write standalone HTML to this path instead of starting a server",
     )
+    parser.add_argument(
+        "--max-inline-file", type=float, default=DEFAULT_MAX_INLINE_FILE / 2**20, metavar="MB",
+        help="Largest file inlined in full; bigger ones are previewed or linked "
+             "(default: %(default)g, 0 = no limit)",
+    )
+    parser.add_argument(
+        "--max-inline-page", type=float, default=DEFAULT_MAX_INLINE_PAGE / 2**20, metavar="MB",
+        help="Total inline output data per page (--static) or per run (server) "
+             "(default: %(default)g, 0 = no limit)",
+    )
+    parser.add_argument(
+        "--include", action="append", default=[], metavar="GLOB",
+        help="Only show runs whose path (relative to the workspace) matches; repeatable",
+    )
+    parser.add_argument(
+        "--exclude", action="append", default=[], metavar="GLOB",
+        help="Don't search directories matching this gitignore-style glob; repeatable "
+             f"(always excluded: {', '.join(DEFAULT_EXCLUDES)})",
+    )
+    parser.add_argument(
+        "--max-depth", type=int, default=DEFAULT_MAX_DEPTH,
+        help="Deepest directory level searched for runs (default: no limit)",
+    )
+    parser.add_argument(
+        "--full-walk", action="store_true",
+        help="Walk eval-* directories fully instead of reading the eval-*/<config>/run-* layout",
+    )
     args = parser.parse_args()
 
     workspace = args.workspace.resolve()
@@ -408,17 +2192,31 @@ def main() -> None:
         print(f"Error: {workspace} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    runs = find_runs(workspace)
-    if not runs:
+    discovery = RunDiscovery(
+        include=tuple(args.include),
+        exclude=DEFAULT_EXCLUDES + tuple(args.exclude),
+        max_depth=args.max_depth,
+        fast_path=not args.full_walk,
+    )
+    found = find_run_dirs(workspace, discovery)
+    if discovery.depth_skipped:
+        print(
+            f"Note: {discovery.depth_skipped} directories below --max-depth {args.max_depth} "
+            f"were not searched for runs",
+            file=sys.stderr,
+        )
+    if not found:
         print(f"No runs found in {workspace}", file=sys.stderr)
         sys.exit(1)
 
     skill_name = args.skill_name or workspace.name.replace("-workspace", "")
     feedback_path = workspace / "feedback.json"
 
+    previous_workspace = args.previous_workspace.resolve() if args.previous_workspace else None
     previous: dict[str, dict] = {}
-    if args.previous_workspace:
-        previous = load_previous_iteration(args.previous_workspace.resolve())
+    if previous_workspace and not args.static:
+        # Server mode only needs output stubs; contents are fetched per run
+        previous = load_previous_iteration(previous_workspace, embed_outputs=False, discovery=discovery)
 
     benchmark_path = args.benchmark.resolve() if args.benchmark else None
     benchmark = None
@@ -428,22 +2226,49 @@ def main() -> None:
         except (json.JSONDecodeError, OSError):
             pass
 
+    budget = EmbedBudget(
+        int(args.max_inline_file * 2**20) if args.max_inline_file > 0 else None,
+        int(args.max_inline_page * 2**20) if args.max_inline_page > 0 else None,
+    )
+
+    diff_cache = DiffCache() if previous_workspace else None
+
     if args.static:
-        html = generate_html(runs, skill_name, previous, benchmark)
         args.static.parent.mkdir(parents=True, exist_ok=True)
-        args.static.write_text(html)
+        try:
+            write_static_html(
+                args.static, workspace, skill_name, previous_workspace, benchmark, budget, diff_cache,
+                discovery,
+            )
+        finally:
+            if diff_cache:
+                diff_cache.close()
         print(f"\n  Static viewer written to: {args.static}\n")
         sys.exit(0)
 
     # Kill any existing process on the target port
     port = args.port
     _kill_port(port)
-    handler = partial(ReviewHandler, workspace, skill_name, feedback_path, previous, benchmark_path)
+    run_cache = RunCache(workspace, budget=budget, discovery=discovery)
+    previous_cache = (
+        RunCache(previous_workspace, previous=True, budget=budget, discovery=discovery)
+        if previous_workspace else None
+    )
+    feedback_log = FeedbackLog(feedback_path)
+    # Fold in edits left in the log by an earlier session that didn't shut down cleanly
+    feedback_log.compact()
+    search_index = SearchIndex(run_cache)
+    # Build the index in the background so the first search doesn't wait for it
+    threading.Thread(target=search_index.sync, daemon=True).start()
+    handler = partial(
+        ReviewHandler, run_cache, skill_name, feedback_log, previous, benchmark_path, previous_cache,
+        diff_cache, search_index,
+    )
     try:
-        server = HTTPServer(("127.0.0.1", port), handler)
+        server = ReviewServer(("127.0.0.1", port), handler, max_workers=args.max_workers)
     except OSError:
         # Port still in use after kill attempt — find a free one
-        server = HTTPServer(("127.0.0.1", 0), handler)
+        server = ReviewServer(("127.0.0.1", 0), handler, max_workers=args.max_workers)
         port = server.server_address[1]
 
     url = f"http://localhost:{port}"
@@ -460,11 +2285,19 @@ def main() -> None:
 
     webbrowser.open(url)
 
+    # A later viewer on the same port stops this one with SIGTERM (see
+    # _kill_port); exit through the finally below so feedback is flushed
+    # and the diff workers are shut down.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nStopped.")
         server.server_close()
+    finally:
+        feedback_log.close()
+        if diff_cache:
+            diff_cache.close()
 
 
 if __name__ == "__main__":
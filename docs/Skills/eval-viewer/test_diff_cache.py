@@ -0,0 +1,40 @@
+"""Checks for DiffCache's bounded caches.
+
+Run with: python -m pytest docs/Skills/eval-viewer/test_diff_cache.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_review import DiffCache  # noqa: E402
+
+
+def _pairs(root: Path, count: int) -> list[tuple[Path, Path]]:
+    pairs = []
+    for i in range(count):
+        current, previous = root / f"new-{i}.txt", root / f"old-{i}.txt"
+        current.write_text(f"line {i}\nchanged\n")
+        previous.write_text(f"line {i}\n")
+        pairs.append((current, previous))
+    return pairs
+
+
+def test_caches_stay_bounded(tmp_path):
+    pairs = _pairs(tmp_path, 5)
+    cache = DiffCache(workers=1, max_diffs=2, max_hashes=3)
+    try:
+        # One call larger than the bound still returns every diff
+        diffs = cache.diffs(pairs)
+        assert [d["name"] for d in diffs] == [f"new-{i}.txt" for i in range(5)]
+        assert all(d["added"] == 1 for d in diffs)
+        assert len(cache._diffs) == 2
+        assert len(cache._hashes) == 3
+
+        # The most recently used entries are the ones kept
+        cache.diffs(pairs[:1])
+        assert pairs[0][0] in cache._hashes
+        assert list(cache._diffs)[-1] == (cache.file_hash(pairs[0][0]), cache.file_hash(pairs[0][1]))
+    finally:
+        cache.close()
@@ -0,0 +1,68 @@
+"""Checks for the size-aware embedding policy (EmbedBudget / embed_file).
+
+Run with: python -m pytest docs/Skills/eval-viewer/test_embed_budget.py
+"""
+
+import base64
+import io
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_review import THUMBNAIL_PX, EmbedBudget, embed_file  # noqa: E402
+
+
+def test_files_within_budget_are_inlined_whole(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("small\n")
+    budget = EmbedBudget(max_file_bytes=100, max_page_bytes=1000)
+    assert embed_file(path, budget=budget) == {"name": "notes.txt", "type": "text", "content": "small\n"}
+    assert budget.used == 6
+
+
+def test_large_text_gets_head_and_tail_preview(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(2000)))
+    size = path.stat().st_size
+    budget = EmbedBudget(max_file_bytes=1000, max_page_bytes=None)
+
+    entry = embed_file(path, budget=budget)
+    assert entry["truncated"] and entry["size"] == size
+    assert entry["link"] == path.resolve().as_uri()
+    assert entry["content"].startswith("line 0\n") and entry["content"].endswith("line 1999\n")
+    assert "bytes omitted" in entry["content"] and len(entry["content"]) < 1100
+    assert budget.used == 1000
+
+
+def test_page_budget_links_files_once_spent(tmp_path):
+    payload = random.Random(1).randbytes(300)
+    paths = []
+    for i in range(3):
+        paths.append(tmp_path / f"blob-{i}.bin")
+        paths[-1].write_bytes(payload)
+    budget = EmbedBudget(max_file_bytes=None, max_page_bytes=900)
+
+    entries = [embed_file(path, budget=budget) for path in paths]
+    assert [e.get("omitted", False) for e in entries] == [False, False, True]
+    assert entries[2]["url"] == entries[2]["link"] == paths[2].resolve().as_uri()
+    assert budget.used <= 900
+
+
+def test_large_image_becomes_thumbnail(tmp_path):
+    image_module = pytest.importorskip("PIL.Image")
+    path = tmp_path / "photo.png"
+    # Noise doesn't compress: the PNG is ~3 MB, far over the file limit
+    image_module.frombytes("RGB", (1200, 900), random.Random(2).randbytes(1200 * 900 * 3)).save(path)
+    budget = EmbedBudget(max_file_bytes=1_000_000, max_page_bytes=None)
+
+    entry = embed_file(path, budget=budget)
+    assert entry["thumbnail"] and entry["size"] == path.stat().st_size
+    assert entry["data_uri"].startswith("data:image/")
+    assert budget.used < 1_000_000
+    raw = base64.b64decode(entry["data_uri"].split(",", 1)[1])
+    with image_module.open(io.BytesIO(raw)) as thumbnail:
+        assert max(thumbnail.size) == THUMBNAIL_PX
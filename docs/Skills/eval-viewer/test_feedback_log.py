@@ -0,0 +1,89 @@
+"""Checks for FeedbackLog replay and compaction.
+
+Run with: python -m pytest docs/Skills/eval-viewer/test_feedback_log.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_review import FEEDBACK_LOG_NAME, FeedbackLog, read_feedback  # noqa: E402
+
+
+def _feedback(data: dict) -> dict[str, str]:
+    return {r["run_id"]: r["feedback"] for r in data["reviews"]}
+
+
+def test_log_replays_onto_snapshot(tmp_path):
+    snapshot = tmp_path / "feedback.json"
+    snapshot.write_text(json.dumps({
+        "reviews": [{"run_id": "a", "feedback": "old a"}, {"run_id": "b", "feedback": "keep b"}],
+        "status": "complete",
+    }))
+    log = FeedbackLog(snapshot, compact_after=100)
+    log.append("a", "first")
+    log.append("c", "new c")
+    log.append("a", "second")
+
+    data = read_feedback(snapshot)
+    assert _feedback(data) == {"a": "second", "b": "keep b", "c": "new c"}
+    assert data["status"] == "in_progress"
+    assert log.read() == data
+
+
+def test_torn_last_line_is_ignored(tmp_path):
+    snapshot = tmp_path / "feedback.json"
+    log = FeedbackLog(snapshot)
+    log.append("a", "saved")
+    log._file.write('{"run_id": "a", "feedb')
+    log._file.flush()
+
+    assert _feedback(read_feedback(snapshot)) == {"a": "saved"}
+
+
+def test_compaction_folds_log_into_snapshot(tmp_path):
+    snapshot = tmp_path / "feedback.json"
+    log_path = tmp_path / FEEDBACK_LOG_NAME
+    log = FeedbackLog(snapshot, compact_after=3)
+    log.append("a", "1")
+    log.append("b", "2")
+    assert log_path.exists() and not snapshot.exists()
+
+    log.append("a", "3")  # reaches compact_after
+    assert not log_path.exists()
+    assert _feedback(json.loads(snapshot.read_text())) == {"a": "3", "b": "2"}
+
+    # Appends after compaction start a fresh log on top of the snapshot
+    log.append("c", "4")
+    log.close()
+    assert not log_path.exists()
+    assert _feedback(read_feedback(snapshot)) == {"a": "3", "b": "2", "c": "4"}
+
+
+def test_leftover_log_counts_towards_compaction(tmp_path):
+    snapshot = tmp_path / "feedback.json"
+    first = FeedbackLog(snapshot, compact_after=3)
+    first.append("a", "1")
+    first.append("b", "2")
+    first._sync()  # as if the server stopped without close()
+
+    second = FeedbackLog(snapshot, compact_after=3)
+    second.append("c", "3")
+    assert not (tmp_path / FEEDBACK_LOG_NAME).exists()
+    assert _feedback(json.loads(snapshot.read_text())) == {"a": "1", "b": "2", "c": "3"}
+
+
+def test_replaying_twice_is_idempotent(tmp_path):
+    # A crash after the snapshot is written but before the log is removed
+    snapshot = tmp_path / "feedback.json"
+    log = FeedbackLog(snapshot, compact_after=100)
+    log.append("a", "1")
+    log.append("a", "2")
+    log._sync()
+    snapshot.write_text(json.dumps(read_feedback(snapshot)))
+
+    assert _feedback(read_feedback(snapshot)) == {"a": "2"}
+    log.close()
+    assert _feedback(json.loads(snapshot.read_text())) == {"a": "2"}
@@ -0,0 +1,55 @@
+"""Regression checks for RunDiscovery's eval-* layout fast path.
+
+Run with: python -m pytest docs/Skills/eval-viewer/test_run_discovery.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_review import RunDiscovery  # noqa: E402
+
+
+def _make_runs(root: Path, *rels: str) -> None:
+    for rel in rels:
+        (root / rel / "outputs").mkdir(parents=True)
+
+
+def _found(root: Path, **kwargs) -> set[str]:
+    return {d.relative_to(root).as_posix() for d in RunDiscovery(**kwargs).find(root)}
+
+
+def test_fast_path_matches_full_walk(tmp_path):
+    _make_runs(
+        tmp_path,
+        "eval-1/with_skill/run-1",
+        "eval-1/with_skill/run-2",
+        "eval-1/without_skill",
+        "eval-2/with_skill/run-1",
+        "eval-2/extra/deep",  # not the layout: eval-2 must be walked
+        "eval-3/with_skill/run-1",
+        "eval-3/with_skill/run-2",
+    )
+    (tmp_path / "eval-3" / ".reviewignore").write_text("run-2\n")
+
+    found = _found(tmp_path)
+    assert found == _found(tmp_path, fast_path=False)
+    assert "eval-2/extra/deep" in found
+    assert "eval-3/with_skill/run-2" not in found
+
+
+def test_fast_path_respects_max_depth(tmp_path):
+    _make_runs(tmp_path, "a/eval-1/with_skill/run-1", "eval-1/with_skill/run-1")
+
+    for depth in range(1, 5):
+        assert _found(tmp_path, max_depth=depth) == _found(tmp_path, max_depth=depth, fast_path=False)
+
+
+def test_depth_cap_reports_skipped_dirs(tmp_path):
+    _make_runs(tmp_path, "a/b/c/d/run")
+
+    discovery = RunDiscovery(max_depth=2)
+    assert discovery.find(tmp_path) == []
+    assert discovery.depth_skipped == 1
+    assert _found(tmp_path) == {"a/b/c/d/run"}
@@ -0,0 +1,47 @@
+"""Checks for SearchIndex's incremental sync and matching.
+
+Run with: python -m pytest docs/Skills/eval-viewer/test_search_index.py
+"""
+
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_review import RunCache, SearchIndex  # noqa: E402
+
+
+def _make_run(root: Path, rel: str, prompt: str, output: str) -> Path:
+    run_dir = root / rel
+    (run_dir / "outputs").mkdir(parents=True)
+    (run_dir / "eval_metadata.json").write_text(json.dumps({"prompt": prompt}))
+    (run_dir / "outputs" / "answer.md").write_text(output)
+    return run_dir
+
+
+def _hits(index: SearchIndex, query: str) -> dict[str, str]:
+    return {r["run_id"]: r["field"] for r in index.search(query)}
+
+
+def test_search_follows_workspace_changes(tmp_path):
+    one = _make_run(tmp_path, "eval-1/with_skill/run-1", "Plot quarterly revenue", "A bar chart of revenue")
+    _make_run(tmp_path, "eval-2/with_skill/run-1", "Summarize the memo", "The memo asks for budget cuts")
+    index = SearchIndex(RunCache(tmp_path, rescan_interval=0))
+
+    assert _hits(index, "revenue") == {"eval-1-with_skill-run-1": "prompt"}
+    assert _hits(index, "budget cuts") == {"eval-2-with_skill-run-1": "output"}
+    assert set(_hits(index, "memo bud")) == {"eval-2-with_skill-run-1"}  # last word as a prefix
+    assert _hits(index, "revenue memo") == {}
+
+    answer = one / "outputs" / "answer.md"
+    answer.write_text("A line chart of headcount")
+    os.utime(answer, ns=(1, 1))
+    assert _hits(index, "headcount") == {"eval-1-with_skill-run-1": "output"}
+    assert _hits(index, "bar chart") == {}
+
+    shutil.rmtree(one)
+    assert _hits(index, "revenue") == {}
+    assert _hits(index, "") == {}
@@ -0,0 +1,72 @@
+"""Checks for the streaming --static export and its content-addressed blobs.
+
+Run with: python -m pytest docs/Skills/eval-viewer/test_static_export.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from generate_review import EmbedBudget, find_runs, write_static_html  # noqa: E402
+
+PNG = bytes.fromhex("89504e470d0a1a0a") + bytes(range(256)) * 8
+
+
+def _make_run(root: Path, rel: str, files: dict[str, bytes]) -> None:
+    outputs = root / rel / "outputs"
+    outputs.mkdir(parents=True)
+    (root / rel / "eval_metadata.json").write_text(json.dumps({"prompt": f"prompt for {rel}"}))
+    for name, data in files.items():
+        (outputs / name).write_bytes(data)
+
+
+def _embedded(page: Path) -> dict:
+    html = page.read_text()
+    start = html.index("const EMBEDDED_DATA = ") + len("const EMBEDDED_DATA = ")
+    data, _ = json.JSONDecoder().raw_decode(html, start)
+    return data
+
+
+def _resolve(outputs: list[dict], blobs: dict) -> list[dict]:
+    """What viewer.html does before rendering: swap each ref for its blob."""
+    return [{**blobs[o["blob"]], "name": o["name"]} if "blob" in o else o for o in outputs]
+
+
+def test_shared_outputs_are_embedded_once(tmp_path):
+    workspace, previous = tmp_path / "iteration-2", tmp_path / "iteration-1"
+    shared = {"report.md": b"# Report\n\nsame text\n", "chart.png": PNG}
+    _make_run(workspace, "eval-1/with_skill/run-1", {**shared, "notes.txt": b"only here\n"})
+    _make_run(workspace, "eval-1/with_skill/run-2", shared)
+    _make_run(previous, "eval-1/with_skill/run-1", {"chart.png": PNG, "old.txt": b"gone\n"})
+
+    page = tmp_path / "review.html"
+    write_static_html(page, workspace, "skill", previous_workspace=previous)
+    data = _embedded(page)
+
+    # report.md, chart.png, notes.txt and old.txt: four distinct contents
+    assert len(data["blobs"]) == 4
+    refs = [o for run in data["runs"] for o in run["outputs"]]
+    assert all("blob" in o and "content" not in o and "data_uri" not in o for o in refs)
+
+    expected = {run["id"]: run["outputs"] for run in find_runs(workspace)}
+    assert {run["id"]: _resolve(run["outputs"], data["blobs"]) for run in data["runs"]} == expected
+    previous_names = [o["name"] for o in _resolve(data["previous_outputs"]["eval-1-with_skill-run-1"], data["blobs"])]
+    assert sorted(previous_names) == ["chart.png", "old.txt"]
+    assert not page.with_name(page.name + ".tmp").exists()
+
+
+def test_budget_is_charged_per_blob(tmp_path):
+    workspace = tmp_path / "workspace"
+    for run in range(1, 6):
+        _make_run(workspace, f"eval-1/with_skill/run-{run}", {"chart.png": PNG})
+
+    # Room for one copy of the image, not five
+    page = tmp_path / "review.html"
+    write_static_html(page, workspace, "skill", budget=EmbedBudget(max_page_bytes=len(PNG) * 2))
+    data = _embedded(page)
+
+    (blob,) = data["blobs"].values()
+    assert blob["data_uri"].startswith("data:image/png;base64,")
+    assert len({o["blob"] for run in data["runs"] for o in run["outputs"]}) == 1
@@ -8,9 +8,22 @@ Reads grading.json files from run directories and produces:
 
 Usage:
     python aggregate_benchmark.py <benchmark_dir>
+    python aggregate_benchmark.py --trend <benchmarks_root>
+    python aggregate_benchmark.py <shard_dir> --partial -o shard-1.partial.json
+    python aggregate_benchmark.py <benchmark_dir> --merge shard-*.partial.json
 
 Example:
     python aggregate_benchmark.py benchmarks/2026-01-15T10-30-00/
+    python aggregate_benchmark.py --trend benchmarks/
+
+Trend mode indexes every <benchmarks_root>/*/benchmark.json into
+<benchmarks_root>/trend_index.json (re-reading only new or changed files)
+and prints a per-timestamp table of each configuration's mean and 95% CI.
+
+Sharded runs: when evals are spread over several machines, run --partial on
+each machine's eval-* tree to write a compact summary (mergeable accumulators
+plus the flattened runs), then --merge the partials into benchmark.json and
+benchmark.md. Only the partial files need to be copied.
 
 The script supports two directory layouts:
 
@@ -37,37 +50,471 @@ The script supports two directory layouts:
 import argparse
 import json
 import math
+import os
+import sqlite3
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:  # Optional: only needed for --bootstrap confidence intervals
+    np = None
 
-def calculate_stats(values: list[float]) -> dict:
-    """Calculate mean, stddev, min, max for a list of values."""
-    if not values:
-        return {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0}
 
-    n = len(values)
-    mean = sum(values) / n
+# Per-run metrics summarized in run_summary
+SUMMARY_METRICS = ("pass_rate", "time_seconds", "tokens")
 
-    if n > 1:
-        variance = sum((x - mean) ** 2 for x in values) / (n - 1)
-        stddev = math.sqrt(variance)
-    else:
-        stddev = 0.0
+# Percentiles reported when RunningStats tracks a quantile sketch
+PERCENTILES = (50, 90, 99)
+
+
+class QuantileSketch:
+    """
+    Mergeable approximate-quantile sketch (a small merging t-digest).
+
+    Values are kept as (mean, weight) centroids. When the buffer grows past
+    the compression budget, neighbouring centroids are merged with a size
+    limit that shrinks towards the tails, so extreme percentiles stay sharp
+    while memory stays bounded regardless of how many values are added.
+    Below the budget every value is its own centroid and results are exact.
+    """
+
+    def __init__(self, compression: int = 100):
+        self.compression = compression
+        self.count = 0
+        self.centroids: list[list[float]] = []
+        self._buffer_limit = 2 * compression
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        self.centroids.append([value, weight])
+        self.count += weight
+        if len(self.centroids) > self._buffer_limit:
+            self._compress()
+
+    def to_dict(self) -> dict:
+        return {"compression": self.compression, "count": self.count, "centroids": self.centroids}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(data["compression"])
+        sketch.count = data["count"]
+        sketch.centroids = [list(c) for c in data["centroids"]]
+        return sketch
+
+    def merge(self, other: "QuantileSketch") -> None:
+        self.centroids.extend([c[0], c[1]] for c in other.centroids)
+        self.count += other.count
+        self._compress()
+
+    def _compress(self) -> None:
+        if len(self.centroids) <= self.compression:
+            self.centroids.sort()
+            return
+        ordered = sorted(self.centroids)
+        merged = [ordered[0]]
+        before = 0.0
+        for mean, weight in ordered[1:]:
+            last = merged[-1]
+            q = (before + last[1] + weight / 2) / self.count
+            limit = max(1.0, 4 * self.count * q * (1 - q) / self.compression)
+            if last[1] + weight <= limit:
+                last[1] += weight
+                last[0] += (mean - last[0]) * weight / last[1]
+            else:
+                before += last[1]
+                merged.append([mean, weight])
+        self.centroids = merged
+        # Tail centroids stay small, so leave headroom to avoid compressing on every add
+        self._buffer_limit = max(2 * self.compression, 2 * len(merged))
+
+    def quantile(self, q: float, lo: float, hi: float) -> float:
+        """Estimate the q-quantile (0..1); lo/hi are the exact min and max."""
+        if not self.centroids:
+            return 0.0
+        self._compress()
+        target = q * self.count
+        prev_center, prev_mean = 0.0, lo
+        cumulative = 0.0
+        for mean, weight in self.centroids:
+            center = cumulative + weight / 2
+            if target <= center:
+                span = center - prev_center
+                frac = (target - prev_center) / span if span else 0.0
+                return prev_mean + (mean - prev_mean) * frac
+            prev_center, prev_mean = center, mean
+            cumulative += weight
+        span = self.count - prev_center
+        frac = (target - prev_center) / span if span else 0.0
+        return prev_mean + (hi - prev_mean) * frac
+
+
+class RunningStats:
+    """
+    Online mean, stddev, min and max using Welford's algorithm.
+
+    Values are consumed one at a time in constant memory, and two accumulators
+    (e.g. from different shards of a benchmark) can be combined with merge().
+    Pass percentiles=True to also track p50/p90/p99 with a QuantileSketch.
+    """
+
+    def __init__(self, percentiles: bool = False):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sketch = QuantileSketch() if percentiles else None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if self.sketch is not None:
+            self.sketch.add(value)
+
+    def to_dict(self) -> dict:
+        """Serialize the accumulator state (used by partial summaries)."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "sketch": self.sketch.to_dict() if self.sketch is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunningStats":
+        acc = cls()
+        acc.count = data["count"]
+        acc.mean = data["mean"]
+        acc.m2 = data["m2"]
+        if acc.count:
+            acc.min, acc.max = data["min"], data["max"]
+        if data.get("sketch"):
+            acc.sketch = QuantileSketch.from_dict(data["sketch"])
+        return acc
+
+    def merge(self, other: "RunningStats") -> None:
+        """Fold another accumulator into this one (Chan et al. parallel update).
+
+        Raises ValueError if only one side tracks percentiles: the other
+        side's values could not be represented in the merged sketch.
+        """
+        if (self.sketch is None) != (other.sketch is None):
+            raise ValueError("cannot merge stats with and without percentiles")
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if self.sketch is not None:
+            self.sketch.merge(other.sketch)
+
+    def summary(self) -> dict:
+        """Return the stats dict used in run_summary (same shape as calculate_stats)."""
+        if self.count == 0:
+            return {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0}
+
+        stddev = math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+        stats = {
+            "mean": round(self.mean, 4),
+            "stddev": round(stddev, 4),
+            "min": round(self.min, 4),
+            "max": round(self.max, 4)
+        }
+        if self.sketch is not None:
+            for p in PERCENTILES:
+                stats[f"p{p}"] = round(self.sketch.quantile(p / 100, self.min, self.max), 4)
+        return stats
+
+
+def calculate_stats(values, percentiles: bool = False) -> dict:
+    """Calculate mean, stddev, min, max for an iterable of values in one pass."""
+    acc = RunningStats(percentiles=percentiles)
+    for value in values:
+        acc.add(value)
+    return acc.summary()
+
+
+def bootstrap_delta(
+    primary: list[float],
+    baseline: list[float],
+    resamples: int = 10000,
+    confidence: float = 0.95,
+    seed: int = 0,
+) -> dict | None:
+    """
+    Bootstrap CI and permutation-test p-value for mean(primary) - mean(baseline).
+
+    Resampling is vectorized with NumPy and processed in blocks so memory stays
+    bounded for large benchmarks. Returns None when NumPy is not installed or
+    either side has no runs.
+    """
+    if np is None or not primary or not baseline:
+        return None
+
+    a = np.asarray(primary, dtype=float)
+    b = np.asarray(baseline, dtype=float)
+    rng = np.random.default_rng(seed)
+    observed = a.mean() - b.mean()
+    block = max(1, 2_000_000 // (len(a) + len(b)))
+
+    boot_deltas = []
+    for start in range(0, resamples, block):
+        n = min(block, resamples - start)
+        boot_a = a[rng.integers(0, len(a), size=(n, len(a)))].mean(axis=1)
+        boot_b = b[rng.integers(0, len(b), size=(n, len(b)))].mean(axis=1)
+        boot_deltas.append(boot_a - boot_b)
+    alpha = (1 - confidence) / 2
+    ci_low, ci_high = np.quantile(np.concatenate(boot_deltas), [alpha, 1 - alpha])
+
+    # Two-sided permutation test: shuffle config labels across the pooled runs
+    pooled = np.concatenate([a, b])
+    extreme = 0
+    for start in range(0, resamples, block):
+        n = min(block, resamples - start)
+        shuffled = rng.permuted(np.tile(pooled, (n, 1)), axis=1)
+        perm_deltas = shuffled[:, :len(a)].mean(axis=1) - shuffled[:, len(a):].mean(axis=1)
+        extreme += int(np.count_nonzero(np.abs(perm_deltas) >= abs(observed) - 1e-12))
+    p_value = (extreme + 1) / (resamples + 1)
 
     return {
-        "mean": round(mean, 4),
-        "stddev": round(stddev, 4),
-        "min": round(min(values), 4),
-        "max": round(max(values), 4)
+        "ci_low": round(float(ci_low), 4),
+        "ci_high": round(float(ci_high), 4),
+        "p_value": round(p_value, 4),
+        "confidence": confidence,
+        "resamples": resamples,
     }
 
 
-def load_run_results(benchmark_dir: Path) -> dict:
+def _feed_stats(stats: dict, config: str, result: dict, percentiles: bool = False) -> None:
+    """Add one run's metrics to the per-config accumulators in `stats`."""
+    config_stats = stats.setdefault(config, {})
+    for metric in SUMMARY_METRICS:
+        if metric not in config_stats:
+            config_stats[metric] = RunningStats(percentiles=percentiles)
+        config_stats[metric].add(result.get(metric, 0))
+
+
+# Bump when _load_run changes what it extracts, so stale cache entries are dropped
+RUN_CACHE_VERSION = 1
+
+
+def _scandir_sorted(path) -> list[os.DirEntry]:
+    """List a directory with os.scandir, sorted by name. Missing dirs yield []."""
+    try:
+        with os.scandir(path) as it:
+            return sorted(it, key=lambda e: e.name)
+    except OSError:
+        return []
+
+
+def _file_stamp(entry: os.DirEntry) -> list[int] | None:
+    """Return [mtime_ns, size] for a directory entry, or None if it can't be stat'd."""
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_run_cache(cache_path: Path) -> dict:
+    """Load a per-run cache written by save_run_cache. Unreadable caches start empty."""
+    try:
+        with open(cache_path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("version") != RUN_CACHE_VERSION:
+        return {}
+    return data.get("runs", {})
+
+
+def _write_json_atomic(path: Path, data, indent: int | None = None) -> None:
+    """Write JSON to a temp file and rename it over `path`."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=indent)
+    os.replace(tmp_path, path)
+
+
+def save_run_cache(cache_path: Path, cache: dict) -> None:
+    """Atomically write the per-run cache next to benchmark.json."""
+    _write_json_atomic(cache_path, {"version": RUN_CACHE_VERSION, "runs": cache})
+
+
+def scan_benchmark_tree(search_dir: Path) -> list[dict]:
+    """
+    Build the eval/config/run inventory of a benchmark directory in one pass.
+
+    Each directory is listed exactly once with os.scandir, so the presence of
+    eval_metadata.json, grading.json and timing.json is known without any
+    further glob calls. Run files also carry their (mtime_ns, size) stamp for
+    the run cache. Returns one dict per eval directory, in the same order
+    load_run_results has always visited them.
+    """
+    inventory = []
+    eval_entries = [
+        e for e in _scandir_sorted(search_dir)
+        if e.name.startswith("eval-") and e.is_dir()
+    ]
+    for eval_idx, eval_entry in enumerate(eval_entries):
+        children = _scandir_sorted(eval_entry.path)
+        configs = []
+        # Discover config directories dynamically rather than hardcoding names
+        for config_entry in children:
+            if not config_entry.is_dir():
+                continue
+            run_entries = [
+                e for e in _scandir_sorted(config_entry.path)
+                if e.name.startswith("run-")
+            ]
+            # Skip non-config directories (inputs, outputs, etc.)
+            if not run_entries:
+                continue
+            runs = []
+            for run_entry in run_entries:
+                stamps = {
+                    e.name: _file_stamp(e)
+                    for e in _scandir_sorted(run_entry.path)
+                    if e.name in ("grading.json", "timing.json")
+                }
+                runs.append({
+                    "dir": Path(run_entry.path),
+                    "run_number": int(run_entry.name.split("-")[1]),
+                    "has_grading": "grading.json" in stamps,
+                    "has_timing": "timing.json" in stamps,
+                    "signature": [stamps.get("grading.json"), stamps.get("timing.json")],
+                })
+            configs.append({"name": config_entry.name, "runs": runs})
+        inventory.append({
+            "eval_idx": eval_idx,
+            "dir": Path(eval_entry.path),
+            "has_metadata": any(c.name == "eval_metadata.json" for c in children),
+            "configs": configs,
+        })
+    return inventory
+
+
+def _load_eval_id(eval_entry: dict) -> int:
+    """Resolve an eval's id from eval_metadata.json or its directory name."""
+    eval_idx = eval_entry["eval_idx"]
+    if eval_entry["has_metadata"]:
+        try:
+            with open(eval_entry["dir"] / "eval_metadata.json") as mf:
+                return json.load(mf).get("eval_id", eval_idx)
+        except (json.JSONDecodeError, OSError):
+            return eval_idx
+    try:
+        return int(eval_entry["dir"].name.split("-")[1])
+    except ValueError:
+        return eval_idx
+
+
+def _load_run(run: dict) -> tuple[dict | None, list[str]]:
+    """
+    Parse one run directory into a result dict.
+
+    Warnings are returned rather than printed so that concurrent loads still
+    report them in directory order. The eval_id slot is filled in by the caller.
+    """
+    run_dir = run["dir"]
+    grading_file = run_dir / "grading.json"
+    warnings = []
+
+    if not run["has_grading"]:
+        warnings.append(f"Warning: grading.json not found in {run_dir}")
+        return None, warnings
+
+    try:
+        with open(grading_file) as f:
+            grading = json.load(f)
+    except json.JSONDecodeError as e:
+        warnings.append(f"Warning: Invalid JSON in {grading_file}: {e}")
+        return None, warnings
+
+    # Extract metrics
+    result = {
+        "eval_id": None,
+        "run_number": run["run_number"],
+        "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
+        "passed": grading.get("summary", {}).get("passed", 0),
+        "failed": grading.get("summary", {}).get("failed", 0),
+        "total": grading.get("summary", {}).get("total", 0),
+    }
+
+    # Extract timing — check grading.json first, then sibling timing.json
+    timing = grading.get("timing", {})
+    result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
+    timing_file = run_dir / "timing.json"
+    if result["time_seconds"] == 0.0 and run["has_timing"]:
+        try:
+            with open(timing_file) as tf:
+                timing_data = json.load(tf)
+            result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
+            result["tokens"] = timing_data.get("total_tokens", 0)
+        except json.JSONDecodeError:
+            pass
+
+    # Extract metrics if available
+    metrics = grading.get("execution_metrics", {})
+    result["tool_calls"] = metrics.get("total_tool_calls", 0)
+    if not result.get("tokens"):
+        result["tokens"] = metrics.get("output_chars", 0)
+    result["errors"] = metrics.get("errors_encountered", 0)
+
+    # Extract expectations — viewer requires fields: text, passed, evidence
+    raw_expectations = grading.get("expectations", [])
+    for exp in raw_expectations:
+        if "text" not in exp or "passed" not in exp:
+            warnings.append(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
+    result["expectations"] = raw_expectations
+
+    # Extract notes from user_notes_summary
+    notes_summary = grading.get("user_notes_summary", {})
+    notes = []
+    notes.extend(notes_summary.get("uncertainties", []))
+    notes.extend(notes_summary.get("needs_review", []))
+    notes.extend(notes_summary.get("workarounds", []))
+    result["notes"] = notes
+
+    return result, warnings
+
+
+def load_run_results(
+    benchmark_dir: Path,
+    workers: int | None = None,
+    cache: dict | None = None,
+    stats: dict | None = None,
+    percentiles: bool = False,
+) -> dict:
     """
     Load all run results from a benchmark directory.
 
+    The directory tree is inventoried once (see scan_benchmark_tree), then the
+    JSON files are read and parsed concurrently on a pool of `workers` threads
+    (None uses the ThreadPoolExecutor default). Results are assembled in
+    directory order, so the output does not depend on the worker count.
+
+    If `cache` is given (see load_run_cache), runs whose grading.json and
+    timing.json still match the cached path, mtime and size are reused without
+    being re-read. The dict is updated in place to hold exactly the runs seen
+    in this scan, ready to be passed to save_run_cache.
+
+    If `stats` is given, each run is also fed into per-config RunningStats
+    accumulators as it is loaded: stats[config][metric] for every metric in
+    SUMMARY_METRICS, ready to be passed to aggregate_results.
+
     Returns dict keyed by config name (e.g. "with_skill"/"without_skill",
     or "new_skill"/"old_skill"), each containing a list of run results.
     """
@@ -81,111 +528,99 @@ def load_run_results(benchmark_dir: Path) -> dict:
         print(f"No eval directories found in {benchmark_dir} or {benchmark_dir / 'runs'}")
         return {}
 
-    results: dict[str, list] = {}
-
-    for eval_idx, eval_dir in enumerate(sorted(search_dir.glob("eval-*"))):
-        metadata_path = eval_dir / "eval_metadata.json"
-        if metadata_path.exists():
-            try:
-                with open(metadata_path) as mf:
-                    eval_id = json.load(mf).get("eval_id", eval_idx)
-            except (json.JSONDecodeError, OSError):
-                eval_id = eval_idx
-        else:
-            try:
-                eval_id = int(eval_dir.name.split("-")[1])
-            except ValueError:
-                eval_id = eval_idx
+    inventory = scan_benchmark_tree(search_dir)
+    all_runs = [
+        run
+        for eval_entry in inventory
+        for config in eval_entry["configs"]
+        for run in config["runs"]
+    ]
 
-        # Discover config directories dynamically rather than hardcoding names
-        for config_dir in sorted(eval_dir.iterdir()):
-            if not config_dir.is_dir():
-                continue
-            # Skip non-config directories (inputs, outputs, etc.)
-            if not list(config_dir.glob("run-*")):
-                continue
-            config = config_dir.name
-            if config not in results:
-                results[config] = []
+    previous = cache if cache is not None else {}
+    keys = [str(run["dir"].relative_to(benchmark_dir)) for run in all_runs]
+    stale = [
+        run for run, key in zip(all_runs, keys)
+        if not run["has_grading"]
+        or previous.get(key, {}).get("signature") != run["signature"]
+    ]
 
-            for run_dir in sorted(config_dir.glob("run-*")):
-                run_number = int(run_dir.name.split("-")[1])
-                grading_file = run_dir / "grading.json"
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        eval_ids = list(pool.map(_load_eval_id, inventory))
+        parsed = iter(pool.map(_load_run, stale))
 
-                if not grading_file.exists():
-                    print(f"Warning: grading.json not found in {run_dir}")
+    fresh_cache: dict[str, dict] = {}
+    results: dict[str, list] = {}
+    run_keys = iter(keys)
+
+    for eval_entry, eval_id in zip(inventory, eval_ids):
+        for config in eval_entry["configs"]:
+            config_results = results.setdefault(config["name"], [])
+            for run in config["runs"]:
+                key = next(run_keys)
+                entry = previous.get(key)
+                if run["has_grading"] and entry and entry["signature"] == run["signature"]:
+                    result, warnings = entry["result"], entry["warnings"]
+                else:
+                    result, warnings = next(parsed)
+                    entry = {"signature": run["signature"], "result": result, "warnings": warnings}
+                if run["has_grading"]:
+                    fresh_cache[key] = entry
+
+                for warning in warnings:
+                    print(warning)
+                if result is None:
                     continue
+                result = dict(result, eval_id=eval_id)
+                config_results.append(result)
+                if stats is not None:
+                    _feed_stats(stats, config["name"], result, percentiles)
 
-                try:
-                    with open(grading_file) as f:
-                        grading = json.load(f)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Invalid JSON in {grading_file}: {e}")
-                    continue
+    if cache is not None:
+        cache.clear()
+        cache.update(fresh_cache)
 
-                # Extract metrics
-                result = {
-                    "eval_id": eval_id,
-                    "run_number": run_number,
-                    "pass_rate": grading.get("summary", {}).get("pass_rate", 0.0),
-                    "passed": grading.get("summary", {}).get("passed", 0),
-                    "failed": grading.get("summary", {}).get("failed", 0),
-                    "total": grading.get("summary", {}).get("total", 0),
-                }
+    return results
 
-                # Extract timing — check grading.json first, then sibling timing.json
-                timing = grading.get("timing", {})
-                result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
-                timing_file = run_dir / "timing.json"
-                if result["time_seconds"] == 0.0 and timing_file.exists():
-                    try:
-                        with open(timing_file) as tf:
-                            timing_data = json.load(tf)
-                        result["time_seconds"] = timing_data.get("total_duration_seconds", 0.0)
-                        result["tokens"] = timing_data.get("total_tokens", 0)
-                    except json.JSONDecodeError:
-                        pass
-
-                # Extract metrics if available
-                metrics = grading.get("execution_metrics", {})
-                result["tool_calls"] = metrics.get("total_tool_calls", 0)
-                if not result.get("tokens"):
-                    result["tokens"] = metrics.get("output_chars", 0)
-                result["errors"] = metrics.get("errors_encountered", 0)
-
-                # Extract expectations — viewer requires fields: text, passed, evidence
-                raw_expectations = grading.get("expectations", [])
-                for exp in raw_expectations:
-                    if "text" not in exp or "passed" not in exp:
-                        print(f"Warning: expectation in {grading_file} missing required fields (text, passed, evidence): {exp}")
-                result["expectations"] = raw_expectations
-
-                # Extract notes from user_notes_summary
-                notes_summary = grading.get("user_notes_summary", {})
-                notes = []
-                notes.extend(notes_summary.get("uncertainties", []))
-                notes.extend(notes_summary.get("needs_review", []))
-                notes.extend(notes_summary.get("workarounds", []))
-                result["notes"] = notes
-
-                results[config].append(result)
 
-    return results
+def _run_order_key(result: dict) -> tuple:
+    """Sort key by (eval_id, run_number); ints first, then anything else as text."""
+    key = []
+    for value in (result.get("eval_id"), result.get("run_number")):
+        key.append((0, value, "") if isinstance(value, int) else (1, 0, str(value)))
+    return tuple(key)
 
 
-def aggregate_results(results: dict) -> dict:
+def aggregate_results(
+    results: dict,
+    stats: dict | None = None,
+    percentiles: bool = False,
+    bootstrap: int = 0,
+) -> dict:
     """
     Aggregate run results into summary statistics.
 
+    Uses the accumulators in `stats` when load_run_results already filled
+    them; otherwise the runs are streamed through fresh RunningStats.
+
+    With `bootstrap` > 0 and NumPy installed, delta also gets a "significance"
+    entry holding ci_low/ci_high/p_value per metric (see bootstrap_delta).
+    Without NumPy the summary is the plain mean/stddev one.
+
     Returns run_summary with stats for each configuration and delta.
     """
     run_summary = {}
     configs = list(results.keys())
 
+    if stats is None:
+        stats = {}
+        for config in configs:
+            for result in results[config]:
+                _feed_stats(stats, config, result, percentiles)
+
     for config in configs:
-        runs = results.get(config, [])
+        config_stats = stats.get(config)
 
-        if not runs:
+        if not config_stats:
             run_summary[config] = {
                 "pass_rate": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
                 "time_seconds": {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0},
@@ -193,14 +628,8 @@ def aggregate_results(results: dict) -> dict:
             }
             continue
 
-        pass_rates = [r["pass_rate"] for r in runs]
-        times = [r["time_seconds"] for r in runs]
-        tokens = [r.get("tokens", 0) for r in runs]
-
         run_summary[config] = {
-            "pass_rate": calculate_stats(pass_rates),
-            "time_seconds": calculate_stats(times),
-            "tokens": calculate_stats(tokens)
+            metric: config_stats[metric].summary() for metric in SUMMARY_METRICS
         }
 
     # Calculate delta between the first two configs (if two exist)
@@ -221,20 +650,64 @@ def aggregate_results(results: dict) -> dict:
         "tokens": f"{delta_tokens:+.0f}"
     }
 
+    if bootstrap > 0 and len(configs) >= 2:
+        if np is None:
+            print("Note: numpy not installed, skipping bootstrap confidence intervals", file=sys.stderr)
+        else:
+            # Resample in a fixed run order so a --merge of shards reproduces
+            # the single-pass result exactly (same seed, same indices)
+            primary_runs = sorted(results[configs[0]], key=_run_order_key)
+            baseline_runs = sorted(results[configs[1]], key=_run_order_key)
+            significance = {}
+            for metric in SUMMARY_METRICS:
+                interval = bootstrap_delta(
+                    [r.get(metric, 0) for r in primary_runs],
+                    [r.get(metric, 0) for r in baseline_runs],
+                    resamples=bootstrap,
+                )
+                if interval:
+                    significance[metric] = interval
+            if significance:
+                run_summary["delta"]["significance"] = significance
+
     return run_summary
 
 
-def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: str = "") -> dict:
+def generate_benchmark(
+    benchmark_dir: Path,
+    skill_name: str = "",
+    skill_path: str = "",
+    workers: int | None = None,
+    cache_path: Path | None = None,
+    percentiles: bool = False,
+    bootstrap: int = 0,
+) -> dict:
     """
     Generate complete benchmark.json from run results.
+
+    With `cache_path`, parsed runs are persisted there and only new or changed
+    runs are re-read on the next call.
     """
-    results = load_run_results(benchmark_dir)
-    run_summary = aggregate_results(results)
+    cache = load_run_cache(cache_path) if cache_path else None
+    stats: dict = {}
+    results = load_run_results(
+        benchmark_dir, workers=workers, cache=cache, stats=stats, percentiles=percentiles,
+    )
+    if cache_path:
+        save_run_cache(cache_path, cache)
+    run_summary = aggregate_results(results, stats=stats, bootstrap=bootstrap)
+    return _assemble_benchmark(_benchmark_runs(results), run_summary, skill_name, skill_path)
+
 
-    # Build runs array for benchmark.json
+def _benchmark_runs(results: dict) -> list[dict]:
+    """Build the runs array for benchmark.json from load_run_results output.
+
+    Runs are grouped by config, then ordered by (eval_id, run_number), so the
+    array does not depend on directory naming or on how shards were split.
+    """
     runs = []
     for config in results:
-        for result in results[config]:
+        for result in sorted(results[config], key=_run_order_key):
             runs.append({
                 "eval_id": result["eval_id"],
                 "configuration": config,
@@ -252,13 +725,13 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
                 "expectations": result["expectations"],
                 "notes": result["notes"]
             })
+    return runs
+
 
+def _assemble_benchmark(runs: list[dict], run_summary: dict, skill_name: str, skill_path: str) -> dict:
+    """Wrap runs and run_summary with metadata into the benchmark.json structure."""
     # Determine eval IDs from results
-    eval_ids = sorted(set(
-        r["eval_id"]
-        for config in results.values()
-        for r in config
-    ))
+    eval_ids = sorted(set(r["eval_id"] for r in runs))
 
     benchmark = {
         "metadata": {
@@ -278,6 +751,343 @@ def generate_benchmark(benchmark_dir: Path, skill_name: str = "", skill_path: st
     return benchmark
 
 
+PARTIAL_VERSION = 1
+
+
+def generate_partial(
+    benchmark_dir: Path,
+    workers: int | None = None,
+    cache_path: Path | None = None,
+    percentiles: bool = False,
+) -> dict:
+    """
+    Summarize one shard of a benchmark for later merging.
+
+    The partial holds the serialized RunningStats for every config and metric
+    plus the shard's flattened runs, which is all merge_partials needs to
+    rebuild benchmark.json without access to the shard's directory tree.
+    """
+    cache = load_run_cache(cache_path) if cache_path else None
+    stats: dict = {}
+    results = load_run_results(
+        benchmark_dir, workers=workers, cache=cache, stats=stats, percentiles=percentiles,
+    )
+    if cache_path:
+        save_run_cache(cache_path, cache)
+
+    return {
+        "version": PARTIAL_VERSION,
+        "configs": list(results),
+        "stats": {
+            config: {metric: acc.to_dict() for metric, acc in config_stats.items()}
+            for config, config_stats in stats.items()
+        },
+        "runs": _benchmark_runs(results),
+    }
+
+
+def merge_partials(
+    partials: list[dict],
+    skill_name: str = "",
+    skill_path: str = "",
+    bootstrap: int = 0,
+) -> dict:
+    """
+    Combine shard partials into a complete benchmark.json structure.
+
+    Accumulators are merged with RunningStats.merge, so the summary matches
+    running aggregate_results over the union of the shards. Configurations
+    keep the order in which they first appear across the partials.
+
+    Raises ValueError if some partials were made with --percentiles and
+    others without.
+    """
+    configs: list[str] = []
+    stats: dict[str, dict[str, RunningStats]] = {}
+    runs: list[dict] = []
+
+    for partial in partials:
+        if partial.get("version") != PARTIAL_VERSION:
+            raise ValueError(f"Unsupported partial summary version: {partial.get('version')}")
+        for config in partial["configs"]:
+            if config not in configs:
+                configs.append(config)
+        for config, config_stats in partial["stats"].items():
+            merged = stats.setdefault(config, {})
+            for metric, data in config_stats.items():
+                acc = RunningStats.from_dict(data)
+                if metric in merged:
+                    try:
+                        merged[metric].merge(acc)
+                    except ValueError:
+                        raise ValueError(
+                            "Partials disagree on --percentiles; regenerate them all with or without it"
+                        ) from None
+                else:
+                    merged[metric] = acc
+        runs.extend(partial["runs"])
+
+    # Group runs by config so benchmark.json lists them the way generate_benchmark does
+    results: dict[str, list] = {config: [] for config in configs}
+    for run in runs:
+        results[run["configuration"]].append(run)
+    for config in configs:
+        results[config].sort(key=_run_order_key)
+    ordered_runs = [run for config in configs for run in results[config]]
+    metric_results = {
+        config: [
+            {**run["result"], "eval_id": run["eval_id"], "run_number": run["run_number"]}
+            for run in results[config]
+        ]
+        for config in configs
+    }
+
+    run_summary = aggregate_results(metric_results, stats=stats, bootstrap=bootstrap)
+    return _assemble_benchmark(ordered_runs, run_summary, skill_name, skill_path)
+
+
+# Scalar per-run columns written to the runs table of a run store
+RUN_COLUMNS = (
+    "pass_rate", "passed", "failed", "total",
+    "time_seconds", "tokens", "tool_calls", "errors",
+)
+
+
+def _run_store_rows(benchmark: dict) -> tuple[list[dict], list[dict], list[dict]]:
+    """Flatten benchmark runs into runs, expectations and notes rows."""
+    runs, expectations, notes = [], [], []
+    for run in benchmark["runs"]:
+        key = {
+            "eval_id": run["eval_id"],
+            "configuration": run["configuration"],
+            "run_number": run["run_number"],
+        }
+        runs.append({**key, **{col: run["result"].get(col) for col in RUN_COLUMNS}})
+        for position, exp in enumerate(run["expectations"]):
+            expectations.append({
+                **key,
+                "position": position,
+                "text": exp.get("text"),
+                "passed": exp.get("passed"),
+                "evidence": exp.get("evidence"),
+            })
+        for position, note in enumerate(run["notes"]):
+            notes.append({**key, "position": position, "note": note})
+    return runs, expectations, notes
+
+
+def write_sqlite_store(benchmark: dict, db_path: Path) -> None:
+    """
+    Write benchmark runs to a SQLite database.
+
+    Tables: runs (one row of scalar metrics per run), expectations and notes
+    (one row per item, keyed by eval_id/configuration/run_number), and
+    metadata (key -> JSON value). The database is rebuilt from scratch and
+    swapped into place atomically.
+    """
+    runs, expectations, notes = _run_store_rows(benchmark)
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        key_cols = "eval_id INTEGER, configuration TEXT, run_number INTEGER"
+        conn.executescript(f"""
+            CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE runs ({key_cols}, pass_rate REAL, passed INTEGER, failed INTEGER,
+                total INTEGER, time_seconds REAL, tokens INTEGER, tool_calls INTEGER, errors INTEGER);
+            CREATE TABLE expectations ({key_cols}, position INTEGER, text TEXT,
+                passed INTEGER, evidence TEXT);
+            CREATE TABLE notes ({key_cols}, position INTEGER, note TEXT);
+            CREATE INDEX runs_by_eval ON runs (eval_id, configuration);
+            CREATE INDEX expectations_by_run ON expectations (eval_id, configuration, run_number);
+            CREATE INDEX notes_by_run ON notes (eval_id, configuration, run_number);
+        """)
+        conn.executemany(
+            "INSERT INTO metadata VALUES (?, ?)",
+            [(k, json.dumps(v)) for k, v in benchmark["metadata"].items()],
+        )
+        for table, rows in (("runs", runs), ("expectations", expectations), ("notes", notes)):
+            if not rows:
+                continue
+            cols = list(rows[0])
+            conn.executemany(
+                f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})",
+                [tuple(row[c] for c in cols) for row in rows],
+            )
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+
+
+def write_parquet_store(benchmark: dict, base_path: Path) -> list[Path]:
+    """
+    Write benchmark runs as Parquet files (requires pyarrow).
+
+    Produces <base>.runs.parquet, <base>.expectations.parquet and
+    <base>.notes.parquet with the same columns as the SQLite tables.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("pyarrow is required for --output-format parquet (pip install pyarrow)")
+
+    written = []
+    for name, rows in zip(("runs", "expectations", "notes"), _run_store_rows(benchmark)):
+        path = base_path.with_suffix(f".{name}.parquet")
+        pq.write_table(pa.Table.from_pylist(rows), path)
+        written.append(path)
+    return written
+
+
+TREND_INDEX_NAME = "trend_index.json"
+TREND_INDEX_VERSION = 1
+
+
+def summarize_for_trend(benchmark: dict) -> dict:
+    """
+    Reduce a benchmark.json to the few numbers the trend index keeps.
+
+    For each configuration and metric: mean, stddev, run count and a normal
+    95% CI of the mean. The delta strings and any bootstrap significance are
+    carried over unchanged.
+    """
+    run_summary = benchmark.get("run_summary", {})
+    counts: dict[str, int] = {}
+    for run in benchmark.get("runs", []):
+        counts[run.get("configuration")] = counts.get(run.get("configuration"), 0) + 1
+
+    configs = {}
+    for config, summary in run_summary.items():
+        if config == "delta":
+            continue
+        n = counts.get(config, 0)
+        configs[config] = {}
+        for metric in SUMMARY_METRICS:
+            stat = summary.get(metric, {})
+            mean, stddev = stat.get("mean", 0.0), stat.get("stddev", 0.0)
+            margin = 1.96 * stddev / math.sqrt(n) if n > 1 else 0.0
+            configs[config][metric] = {
+                "mean": mean,
+                "stddev": stddev,
+                "n": n,
+                "ci_low": round(mean - margin, 4),
+                "ci_high": round(mean + margin, 4),
+            }
+
+    metadata = benchmark.get("metadata", {})
+    return {
+        "timestamp": metadata.get("timestamp", ""),
+        "skill_name": metadata.get("skill_name", ""),
+        "configs": configs,
+        "delta": run_summary.get("delta", {}),
+    }
+
+
+def update_trend_index(benchmarks_root: Path) -> dict:
+    """
+    Index every <benchmarks_root>/*/benchmark.json into trend_index.json.
+
+    Each entry is keyed by directory name and stamped with the file's mtime
+    and size, so only new or modified benchmarks are read; entries whose
+    directory disappeared are dropped. Returns the updated index.
+    """
+    index_path = benchmarks_root / TREND_INDEX_NAME
+    entries: dict[str, dict] = {}
+    try:
+        with open(index_path) as f:
+            data = json.load(f)
+        if data.get("version") == TREND_INDEX_VERSION:
+            entries = data.get("entries", {})
+    except (OSError, json.JSONDecodeError):
+        pass
+
+    fresh: dict[str, dict] = {}
+    changed = False
+    for entry in _scandir_sorted(benchmarks_root):
+        if not entry.is_dir():
+            continue
+        benchmark_file = Path(entry.path) / "benchmark.json"
+        try:
+            st = benchmark_file.stat()
+        except OSError:
+            continue
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = entries.get(entry.name)
+        if cached and cached.get("stamp") == stamp:
+            fresh[entry.name] = cached
+            continue
+        try:
+            with open(benchmark_file) as f:
+                benchmark = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: skipping {benchmark_file}: {e}")
+            continue
+        fresh[entry.name] = {"stamp": stamp, **summarize_for_trend(benchmark)}
+        changed = True
+
+    if changed or fresh.keys() != entries.keys():
+        _write_json_atomic(index_path, {"version": TREND_INDEX_VERSION, "entries": fresh}, indent=2)
+    return fresh
+
+
+def generate_trend_markdown(entries: dict, metric: str = "pass_rate") -> str:
+    """
+    Render the trend index as a markdown table, oldest benchmark first.
+
+    Benchmarks are ordered by directory name: benchmarks/<timestamp>/ is
+    named when the benchmark runs, whereas metadata.timestamp records when
+    benchmark.json was last aggregated, which re-aggregating an old
+    benchmark moves forward. That time is shown as "Aggregated".
+
+    Each cell is the config's mean with its 95% CI. A mean that falls below
+    the previous benchmark's CI for the same config (above it, for time and
+    tokens) is flagged as a regression.
+    """
+    ordered = sorted(entries.items())
+    configs: list[str] = []
+    for _, entry in ordered:
+        for config in entry["configs"]:
+            if config not in configs:
+                configs.append(config)
+
+    pct = metric == "pass_rate"
+    higher_is_better = metric == "pass_rate"
+
+    def fmt(value: float) -> str:
+        return f"{value*100:.0f}%" if pct else f"{value:.1f}"
+
+    labels = [c.replace("_", " ").title() for c in configs]
+    lines = [
+        f"# Benchmark Trend: {metric}",
+        "",
+        "| Benchmark | Aggregated | " + " | ".join(labels) + " | Delta |",
+        "|-----------|------------|" + "|".join("-" * (len(label) + 2) for label in labels) + "|-------|",
+    ]
+    previous: dict[str, dict] = {}
+    for name, entry in ordered:
+        cells = []
+        for config in configs:
+            stat = entry["configs"].get(config, {}).get(metric)
+            if not stat:
+                cells.append("—")
+                continue
+            cell = f"{fmt(stat['mean'])} [{fmt(stat['ci_low'])}, {fmt(stat['ci_high'])}]"
+            prev = previous.get(config)
+            if prev and (
+                stat["mean"] < prev["ci_low"] if higher_is_better else stat["mean"] > prev["ci_high"]
+            ):
+                cell += " ▼ regression"
+            cells.append(cell)
+            previous[config] = stat
+        delta = entry.get("delta", {}).get(metric, "—")
+        lines.append(f"| {name} | {entry.get('timestamp', '')} | " + " | ".join(cells) + f" | {delta} |")
+
+    return "\n".join(lines)
+
+
 def generate_markdown(benchmark: dict) -> str:
     """Generate human-readable benchmark.md from benchmark data."""
     metadata = benchmark["metadata"]
@@ -322,6 +1132,21 @@ def generate_markdown(benchmark: dict) -> str:
     b_tokens = b_summary.get("tokens", {})
     lines.append(f"| Tokens | {a_tokens.get('mean', 0):.0f} ± {a_tokens.get('stddev', 0):.0f} | {b_tokens.get('mean', 0):.0f} ± {b_tokens.get('stddev', 0):.0f} | {delta.get('tokens', '—')} |")
 
+    # Bootstrap confidence intervals for the delta, when computed
+    significance = delta.get("significance", {})
+    if significance:
+        first = next(iter(significance.values()))
+        lines.extend([
+            "",
+            f"## Delta Significance ({first['confidence']*100:.0f}% bootstrap CI, {first['resamples']} resamples)",
+            "",
+            "| Metric | CI Low | CI High | p-value |",
+            "|--------|--------|---------|---------|",
+        ])
+        labels = {"pass_rate": "Pass Rate", "time_seconds": "Time", "tokens": "Tokens"}
+        for metric, interval in significance.items():
+            lines.append(f"| {labels.get(metric, metric)} | {interval['ci_low']:+g} | {interval['ci_high']:+g} | {interval['p_value']:.4f} |")
+
     # Notes section
     if benchmark.get("notes"):
         lines.extend([
@@ -342,7 +1167,30 @@ def main():
     parser.add_argument(
         "benchmark_dir",
         type=Path,
-        help="Path to the benchmark directory"
+        help="Path to the benchmark directory (or, with --trend, the directory of timestamped benchmarks)"
+    )
+    parser.add_argument(
+        "--trend",
+        action="store_true",
+        help="Index every <benchmark_dir>/*/benchmark.json and print a trend table"
+    )
+    parser.add_argument(
+        "--trend-metric",
+        choices=list(SUMMARY_METRICS),
+        default="pass_rate",
+        help="Metric shown in the trend table (default: pass_rate)"
+    )
+    parser.add_argument(
+        "--partial",
+        action="store_true",
+        help="Write a mergeable shard summary (default: <benchmark_dir>/benchmark.partial.json) instead of benchmark.json"
+    )
+    parser.add_argument(
+        "--merge",
+        type=Path,
+        nargs="+",
+        metavar="PARTIAL",
+        help="Merge shard summaries from --partial into <benchmark_dir>/benchmark.json"
     )
     parser.add_argument(
         "--skill-name",
@@ -359,19 +1207,100 @@ def main():
         type=Path,
         help="Output path for benchmark.json (default: <benchmark_dir>/benchmark.json)"
     )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=None,
+        help="Threads used to read run files (default: ThreadPoolExecutor default)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-read every run instead of reusing <output>.cache.json"
+    )
+    parser.add_argument(
+        "--percentiles",
+        action="store_true",
+        help="Also report approximate p50/p90/p99 for each metric"
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Add bootstrap CIs and permutation p-values for the delta using N resamples (requires numpy, e.g. 10000)"
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["json", "sqlite", "parquet"],
+        default="json",
+        help="Also write runs to a queryable store: <output>.sqlite or <output>.*.parquet (default: json only)"
+    )
 
     args = parser.parse_args()
 
+    if args.output_format != "json" and (args.partial or args.trend):
+        mode = "--partial" if args.partial else "--trend"
+        parser.error(f"--output-format {args.output_format} can't be combined with {mode} (it applies to benchmark.json)")
+
+    if args.merge:
+        args.benchmark_dir.mkdir(parents=True, exist_ok=True)
+
     if not args.benchmark_dir.exists():
         print(f"Directory not found: {args.benchmark_dir}")
         sys.exit(1)
 
-    # Generate benchmark
-    benchmark = generate_benchmark(args.benchmark_dir, args.skill_name, args.skill_path)
+    if args.trend:
+        entries = update_trend_index(args.benchmark_dir)
+        if not entries:
+            print(f"No */benchmark.json found in {args.benchmark_dir}")
+            sys.exit(1)
+        markdown = generate_trend_markdown(entries, args.trend_metric)
+        if args.output:
+            args.output.write_text(markdown + "\n")
+            print(f"Generated: {args.output}")
+        else:
+            print(markdown)
+        return
+
+    if args.partial:
+        output_partial = args.output or (args.benchmark_dir / "benchmark.partial.json")
+        cache_path = None if args.no_cache else output_partial.with_suffix(".cache.json")
+        partial = generate_partial(
+            args.benchmark_dir, workers=args.workers, cache_path=cache_path,
+            percentiles=args.percentiles,
+        )
+        with open(output_partial, "w") as f:
+            json.dump(partial, f)
+        print(f"Generated: {output_partial} ({len(partial['runs'])} runs)")
+        return
 
     # Determine output paths
     output_json = args.output or (args.benchmark_dir / "benchmark.json")
     output_md = output_json.with_suffix(".md")
+    cache_path = None if args.no_cache else output_json.with_suffix(".cache.json")
+
+    # Generate benchmark
+    if args.merge:
+        partials = []
+        for partial_path in args.merge:
+            try:
+                with open(partial_path) as f:
+                    partials.append(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error: cannot read partial {partial_path}: {e}", file=sys.stderr)
+                sys.exit(1)
+        try:
+            benchmark = merge_partials(partials, args.skill_name, args.skill_path, bootstrap=args.bootstrap)
+        except (KeyError, ValueError) as e:
+            print(f"Error: invalid partial summary: {e}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        benchmark = generate_benchmark(
+            args.benchmark_dir, args.skill_name, args.skill_path,
+            workers=args.workers, cache_path=cache_path, percentiles=args.percentiles,
+            bootstrap=args.bootstrap,
+        )
 
     # Write benchmark.json
     with open(output_json, "w") as f:
@@ -384,6 +1313,19 @@ def main():
         f.write(markdown)
     print(f"Generated: {output_md}")
 
+    # Write the optional run store
+    if args.output_format == "sqlite":
+        output_db = output_json.with_suffix(".sqlite")
+        write_sqlite_store(benchmark, output_db)
+        print(f"Generated: {output_db}")
+    elif args.output_format == "parquet":
+        try:
+            for path in write_parquet_store(benchmark, output_json):
+                print(f"Generated: {path}")
+        except RuntimeError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
     # Print summary
     run_summary = benchmark["run_summary"]
     configs = [k for k in run_summary if k != "delta"]
@@ -7,37 +7,67 @@ uses the session's Claude Code auth, no separate ANTHROPIC_API_KEY needed).
 """
 
 import argparse
+import hashlib
 import json
 import os
+import queue
 import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from scripts.utils import parse_skill_md
 
 
-def _call_claude(prompt: str, model: str | None, timeout: int = 300) -> str:
-    """Run `claude -p` with the prompt on stdin and return the text response.
-
-    Prompt goes over stdin (not argv) because it embeds the full SKILL.md
-    body and can easily exceed comfortable argv length.
-    """
-    cmd = ["claude", "-p", "--output-format", "text"]
+def _claude_command(model: str | None, command: tuple[str, ...] = ("claude",)) -> list[str]:
+    cmd = [*command, "-p", "--output-format", "text"]
     if model:
         cmd.extend(["--model", model])
+    return cmd
+
 
+def _claude_env() -> dict[str, str]:
     # Remove CLAUDECODE env var to allow nesting claude -p inside a
     # Claude Code session. The guard is for interactive terminal conflicts;
     # programmatic subprocess usage is safe. Same pattern as run_eval.py.
-    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+    return {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+
+
+def _call_claude(
+    prompt: str,
+    model: str | None,
+    timeout: int = 300,
+    pool: "ClaudePool | None" = None,
+    cache: "ResponseCache | None" = None,
+) -> str:
+    """Run `claude -p` with the prompt on stdin and return the text response.
+
+    Prompt goes over stdin (not argv) because it embeds the full SKILL.md
+    body and can easily exceed comfortable argv length. With a pool, the
+    prompt goes to one of its workers, warm if one was started. With a
+    cache, a response already stored for this model and prompt is returned
+    without calling the model, and new responses are stored.
+    """
+    if cache is not None:
+        cached = cache.get(model, prompt)
+        if cached is not None:
+            return cached
+        text = _call_claude(prompt, model, timeout=timeout, pool=pool)
+        cache.put(model, prompt, text)
+        return text
+
+    if pool is not None:
+        return pool.call(prompt, timeout=timeout)
 
     result = subprocess.run(
-        cmd,
+        _claude_command(model),
         input=prompt,
         capture_output=True,
         text=True,
-        env=env,
+        env=_claude_env(),
         timeout=timeout,
     )
     if result.returncode != 0:
@@ -47,18 +77,241 @@ def _call_claude(prompt: str, model: str | None, timeout: int = 300) -> str:
     return result.stdout
 
 
-def improve_description(
+class ClaudePool:
+    """Up to `size` `claude -p` processes started ahead of the calls that need them.
+
+    `claude -p` answers exactly one prompt per process, so a process can't
+    be reused. Instead the pool can start workers ahead of time: CLI startup
+    and auth happen while a worker waits on stdin, and a call only pays for
+    writing the prompt and the model's answer. Nothing is started until
+    asked for: warm(n) starts workers for n calls the caller knows are
+    coming, and a call with no warm worker starts one on demand.
+    improve_description warms one worker per uncached prompt plus a spare
+    for the possible shorten retry, whose startup then overlaps the first
+    call; a run answered entirely from the cache never starts `claude`.
+    Workers that died, or sat idle longer than max_idle seconds, are
+    recycled before use. Safe to share between threads.
+
+    `command` replaces the `claude` executable, e.g. with a stub CLI for
+    testing.
+    """
+
+    def __init__(
+        self,
+        model: str | None,
+        size: int = 2,
+        max_idle: float = 600.0,
+        command: tuple[str, ...] = ("claude",),
+    ):
+        self.cmd = _claude_command(model, command)
+        self.size = size
+        self.max_idle = max_idle
+        self._env = _claude_env()
+        self._idle: queue.Queue = queue.Queue()
+        self._closed = False
+
+    def warm(self, n: int | None = None) -> None:
+        """Start workers until min(n, size) are idle (n defaults to size)."""
+        want = self.size if n is None else min(n, self.size)
+        for _ in range(want - self._idle.qsize()):
+            if self._closed:
+                break
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> tuple[subprocess.Popen, float]:
+        proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=self._env,
+        )
+        return proc, time.monotonic()
+
+    def _take(self) -> subprocess.Popen:
+        """A warm worker if there is one, else a new one; stale ones are recycled."""
+        try:
+            proc, started = self._idle.get_nowait()
+        except queue.Empty:
+            return self._spawn()[0]
+        if proc.poll() is not None or time.monotonic() - started > self.max_idle:
+            _kill(proc)
+            proc, started = self._spawn()
+        return proc
+
+    def call(self, prompt: str, timeout: int = 300) -> str:
+        proc = self._take()
+        try:
+            stdout, stderr = proc.communicate(prompt, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _kill(proc)
+            raise
+        if proc.returncode != 0:
+            raise RuntimeError(f"claude -p exited {proc.returncode}\nstderr: {stderr}")
+        return stdout
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                proc, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            _kill(proc)
+
+    def __enter__(self) -> "ClaudePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    if proc.poll() is None:
+        proc.kill()
+    proc.communicate()
+
+
+def default_cache_dir() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "skill-creator" / "improve_description"
+
+
+class ResponseCache:
+    """On-disk cache of raw `claude -p` responses, keyed by model and prompt.
+
+    Each response is stored in its own file named by the sha256 of the model
+    and prompt, so identical prompts from a repeated or resumed run (or a CI
+    replay) are answered from disk. Entries older than `ttl` seconds are
+    ignored and removed. A hit refreshes the entry's mtime, and once the
+    cache grows past `max_bytes` the least recently used entries are evicted.
+    Only successful responses are stored. Writes are atomic, so concurrent
+    calls (beam mode) and concurrent runs can share one directory. If the
+    directory can't be used (read-only, missing, disk full), the cache warns
+    once and turns itself off; the run carries on uncached.
+    """
+
+    def __init__(self, root: Path, ttl: float = 7 * 86400, max_bytes: int = 100 * 1024 * 1024):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.disabled = False
+        self._lock = threading.Lock()
+
+    def _disable(self, error: OSError) -> None:
+        with self._lock:
+            if self.disabled:
+                return
+            self.disabled = True
+        print(f"Warning: response cache disabled ({error}); continuing without it", file=sys.stderr)
+
+    def _path(self, model: str | None, prompt: str) -> Path:
+        key = hashlib.sha256(f"{model or ''}\0{prompt}".encode()).hexdigest()
+        return self.root / key[:2] / f"{key}.json"
+
+    def contains(self, model: str | None, prompt: str) -> bool:
+        """Whether an entry exists (it may still turn out expired or malformed)."""
+        return self._path(model, prompt).exists()
+
+    def get(self, model: str | None, prompt: str) -> str | None:
+        path = self._path(model, prompt)
+        response = None
+        if not self.disabled:
+            try:
+                entry = json.loads(path.read_text())
+                if time.time() - float(entry["created"]) <= self.ttl and isinstance(entry["response"], str):
+                    response = entry["response"]
+            except FileNotFoundError:
+                pass
+            except (ValueError, KeyError, TypeError):
+                pass  # malformed (truncated or hand-edited): removed below
+            except OSError as e:
+                self._disable(e)
+        if response is None and not self.disabled:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                self._disable(e)
+        with self._lock:
+            if response is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return response
+
+    def put(self, model: str | None, prompt: str, response: str) -> None:
+        if self.disabled:
+            return
+        path = self._path(model, prompt)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"model": model, "created": time.time(), "response": response}))
+            os.replace(tmp, path)
+        except OSError as e:
+            self._disable(e)
+            try:
+                tmp.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove expired entries, then least recently used ones until under max_bytes."""
+        if self.disabled:
+            return
+        try:
+            entries = []
+            now = time.time()
+            for path in self.root.glob("*/*.json"):
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue  # evicted by a concurrent run
+                if now - st.st_mtime > self.ttl:
+                    path.unlink(missing_ok=True)
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+        except OSError as e:
+            self._disable(e)
+
+
+STYLE_HINTS = [
+    "Lead with one imperative sentence naming the user's goal, then list the situations that should trigger the skill.",
+    "Write it as a compact run of user intents separated by semicolons, with no preamble.",
+    "Keep it very short: at most two sentences and about 60 words.",
+    "After the positive triggers, briefly name the nearby requests this skill should NOT be used for.",
+    "Open with the most distinctive keywords a user would actually type, then explain the intent behind them.",
+    "Describe the concrete artifacts or outcomes the user wants, rather than the tasks involved.",
+]
+
+
+def _build_prompt(
     skill_name: str,
     skill_content: str,
     current_description: str,
     eval_results: dict,
     history: list[dict],
-    model: str,
     test_results: dict | None = None,
-    log_dir: Path | None = None,
-    iteration: int | None = None,
+    style_hint: str | None = None,
+    omitted_attempts: int = 0,
+    query_chars: int | None = None,
+    max_queries: int | None = None,
 ) -> str:
-    """Call Claude to improve the description based on eval results."""
     failed_triggers = [
         r for r in eval_results["results"]
         if r["should_trigger"] and not r["pass"]
@@ -90,18 +343,18 @@ Current scores ({scores_summary}):
 """
     if failed_triggers:
         prompt += "FAILED TO TRIGGER (should have triggered but didn't):\n"
-        for r in failed_triggers:
-            prompt += f'  - "{r["query"]}" (triggered {r["triggers"]}/{r["runs"]} times)\n'
+        prompt += _query_lines(failed_triggers, query_chars, max_queries)
         prompt += "\n"
 
     if false_triggers:
         prompt += "FALSE TRIGGERS (triggered but shouldn't have):\n"
-        for r in false_triggers:
-            prompt += f'  - "{r["query"]}" (triggered {r["triggers"]}/{r["runs"]} times)\n'
+        prompt += _query_lines(false_triggers, query_chars, max_queries)
         prompt += "\n"
 
-    if history:
+    if history or omitted_attempts:
         prompt += "PREVIOUS ATTEMPTS (do NOT repeat these — try something structurally different):\n\n"
+        if omitted_attempts:
+            prompt += f"({omitted_attempts} earlier attempts omitted for length)\n\n"
         for h in history:
             train_s = f"{h.get('train_passed', h.get('passed', 0))}/{h.get('train_total', h.get('total', 0))}"
             test_s = f"{h.get('test_passed', '?')}/{h.get('test_total', '?')}" if h.get('test_passed') is not None else None
@@ -113,6 +366,8 @@ Current scores ({scores_summary}):
                 for r in h["results"]:
                     status = "PASS" if r["pass"] else "FAIL"
                     prompt += f'  [{status}] "{r["query"][:80]}" (triggered {r["triggers"]}/{r["runs"]})\n'
+                if h.get("unchanged_results"):
+                    prompt += f'  ({h["unchanged_results"]} other queries: same as the previous attempt)\n'
             if h.get("note"):
                 prompt += f'Note: {h["note"]}\n'
             prompt += "</attempt>\n\n"
@@ -138,29 +393,350 @@ Here are some tips that we've found to work well in writing these descriptions:
 - If you're getting lots of failures after repeated attempts, change things up. Try different sentence structures or wordings.
 
 I'd encourage you to be creative and mix up the style in different iterations since you'll have multiple opportunities to try different approaches and we'll just grab the highest-scoring one at the end. 
+"""
+    if style_hint:
+        prompt += f"\nFor this attempt specifically: {style_hint}\n"
+    prompt += "\nPlease respond with only the new description text in <new_description> tags, nothing else."
+
+    return prompt
 
-Please respond with only the new description text in <new_description> tags, nothing else."""
 
-    text = _call_claude(prompt, model)
+def _query_lines(results: list[dict], query_chars: int | None = None, max_queries: int | None = None) -> str:
+    """Render failed queries as prompt list lines.
 
+    With query_chars, each query is cut to that many chars and queries that
+    then read the same are listed once with their trigger counts summed;
+    with max_queries, only the first that many are listed, plus a count of
+    the rest.
+    """
+    entries = [(r["query"], r["triggers"], r["runs"]) for r in results]
+    if query_chars is not None:
+        merged: dict[str, list[int]] = {}
+        for query, triggers, runs in entries:
+            if len(query) > query_chars:
+                query = query[:query_chars].rstrip() + "..."
+            totals = merged.setdefault(query, [0, 0])
+            totals[0] += triggers
+            totals[1] += runs
+        entries = [(query, triggers, runs) for query, (triggers, runs) in merged.items()]
+    lines = [f'  - "{query}" (triggered {triggers}/{runs} times)\n' for query, triggers, runs in entries]
+    if max_queries is not None and len(lines) > max_queries:
+        lines = lines[:max_queries] + [f"  ({len(lines) - max_queries} more not shown)\n"]
+    return "".join(lines)
+
+
+DEFAULT_PROMPT_BUDGET = 60_000  # chars, roughly 15k tokens
+RECENT_ATTEMPTS = 2  # attempts that keep their per-query results longest
+MIN_SKILL_CONTENT = 2_000
+QUERY_CHAR_LIMITS = (200, 80)  # per-query cuts tried when compacting the failure lists
+QUERY_COUNT_LIMITS = (50, 20, 10)  # then caps on how many queries each list shows
+SECTION_PRIORITY_RE = re.compile(
+    r"\b(when|use|usage|overview|purpose|trigger|about|description|summary|what)", re.IGNORECASE,
+)
+
+
+def _dedupe_results(history: list[dict]) -> list[dict]:
+    """History where each attempt lists only the query results that changed.
+
+    A query whose pass/triggers/runs match the previous attempt is replaced
+    by an "unchanged_results" count; the first attempt keeps everything.
+    """
+    deduped = []
+    previous: dict = {}
+    for h in history:
+        if "results" not in h:
+            deduped.append(h)
+            continue
+        current = {r["query"]: (r["pass"], r["triggers"], r["runs"]) for r in h["results"]}
+        changed = [r for r in h["results"] if previous.get(r["query"]) != current[r["query"]]]
+        deduped.append({**h, "results": changed, "unchanged_results": len(h["results"]) - len(changed)})
+        previous = current
+    return deduped
+
+
+def _skill_sections(content: str) -> list[str]:
+    """Split markdown at headings outside code fences; the first part is any preamble."""
+    sections = [""]
+    in_fence = False
+    for line in content.splitlines(keepends=True):
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and re.match(r"#{1,6} ", line):
+            sections.append("")
+        sections[-1] += line
+    return [sec for sec in sections if sec]
+
+
+def _truncate_skill_content(content: str, limit: int) -> str:
+    """Fit content into limit chars, keeping the most useful sections whole.
+
+    The opening section and sections whose heading describes what the skill
+    is for or when to use it are kept first, then the rest in document
+    order. Sections that don't fit shrink to their heading plus a marker
+    (or a cut-off head, if there's room for one), so the model still sees
+    the skill's full outline.
+    """
+    if len(content) <= limit:
+        return content
+    sections = _skill_sections(content)
+
+    def stub(sec: str) -> str:
+        heading = sec.splitlines(keepends=True)[0] if sec.startswith("#") else ""
+        return f"{heading}[... {len(sec) - len(heading)} chars omitted ...]\n\n"
+
+    def priority(i: int) -> tuple[int, int]:
+        if i == 0:
+            return 0, i
+        heading = sections[i].splitlines()[0]
+        return (1 if SECTION_PRIORITY_RE.search(heading) else 2), i
+
+    parts = [stub(sec) for sec in sections]
+    room = limit - sum(len(part) for part in parts)
+    for i in sorted(range(len(sections)), key=priority):
+        extra = len(sections[i]) - len(parts[i])
+        if extra <= room:
+            parts[i] = sections[i]
+            room -= extra
+        elif room > 200:
+            marker = f"[... {len(sections[i]) - room} chars omitted ...]\n\n"
+            head = sections[i][:room + len(parts[i]) - len(marker)]
+            # Cut at a line end, or mid-line if the head has none
+            parts[i] = head[:head.rfind("\n") + 1 or len(head)] + marker
+            room = 0
+    return "".join(parts)
+
+
+def _fit_prompt(
+    build, history: list[dict], skill_content: str, budget: int,
+) -> tuple[str, dict]:
+    """Build a prompt, compacting history and skill content until it fits budget chars.
+
+    `build(history, omitted_attempts, skill_content, **compact)` renders the
+    prompt, passing `compact` (query_chars, max_queries) on to _query_lines.
+    Steps apply in order and stop as soon as the prompt fits: list only
+    changed query results, drop per-query results from all but the
+    RECENT_ATTEMPTS latest attempts, drop the oldest attempts down to those,
+    truncate skill_content by section priority, then shorten and cap the
+    FAILED TO TRIGGER / FALSE TRIGGERS lists. A prompt already under budget
+    (or budget <= 0) is returned unchanged. Also returns a report of the
+    sizes before and after for the transcript, with over_budget set if the
+    prompt still doesn't fit.
+    """
+    prompt = build(history, 0, skill_content)
+    report: dict = {"budget": budget, "original_chars": len(prompt), "steps": []}
+
+    def fits() -> bool:
+        return budget <= 0 or len(prompt) <= budget
+
+    def step(name: str) -> None:
+        report["steps"].append({"step": name, "chars": len(prompt)})
+
+    omitted = 0
+    original = history
+    if not fits() and history:
+        history = _dedupe_results(history)
+        prompt = build(history, omitted, skill_content)
+        step("dedupe_results")
+    if not fits() and len(history) > RECENT_ATTEMPTS:
+        cut = len(history) - RECENT_ATTEMPTS
+        # Re-dedupe the detailed tail on its own: its first attempt's
+        # results can't be relative to one whose results are gone
+        history = [
+            {k: v for k, v in h.items() if k not in ("results", "unchanged_results")}
+            for h in history[:cut]
+        ] + _dedupe_results(original[cut:])
+        prompt = build(history, omitted, skill_content)
+        step("summarize_attempts")
+    while not fits() and len(history) > RECENT_ATTEMPTS:
+        history = history[1:]
+        omitted += 1
+        prompt = build(history, omitted, skill_content)
+    if omitted:
+        step("drop_attempts")
+    if not fits():
+        limit = max(budget - (len(prompt) - len(skill_content)), MIN_SKILL_CONTENT)
+        skill_content = _truncate_skill_content(skill_content, limit)
+        prompt = build(history, omitted, skill_content)
+        step("truncate_skill_content")
+    compact: dict = {}
+    for query_chars in QUERY_CHAR_LIMITS:
+        if fits():
+            break
+        compact["query_chars"] = query_chars
+        prompt = build(history, omitted, skill_content, **compact)
+        step(f"shorten_queries_{query_chars}")
+    for max_queries in QUERY_COUNT_LIMITS:
+        if fits():
+            break
+        compact["max_queries"] = max_queries
+        prompt = build(history, omitted, skill_content, **compact)
+        step(f"limit_queries_{max_queries}")
+
+    report["final_chars"] = len(prompt)
+    report["over_budget"] = not fits()
+    report["original_tokens_approx"] = report["original_chars"] // 4
+    report["final_tokens_approx"] = report["final_chars"] // 4
+    return prompt, report
+
+
+MAX_DESCRIPTION_CHARS = 1024
+STOPWORDS = frozenset("""
+    a an and are as at be but by can could do does for from has have how i if in into is it its
+    me my of on or our please so that the their them then there these this those to use using
+    was we what when where which who why will with would you your
+""".split())
+FILLER_REWRITES = [
+    (r"\bin order to\b", "to"),
+    (r"\bis able to\b", "can"),
+    (r"\bare able to\b", "can"),
+    (r"\bwhether or not\b", "whether"),
+    (r"\bdue to the fact that\b", "because"),
+    (r"\bincluding but not limited to\b", "including"),
+    (r"\ba (?:wide )?variety of\b", "various"),
+    (r"\bany and all\b", "all"),
+    (r"\band/or\b", "or"),
+    (r"\bfor example\b", "e.g."),
+    # Pure intensifiers only, and never after a negation ("not very", "isn't
+    # really") or "only": words like "just" and "simply" can carry the meaning
+    (r"(?<=\s)(?<!not )(?<!n't )(?<!only )(?:basically|really|very|actually|essentially) ", ""),
+]
+
+# How often an over-long description was fixed locally vs. sent back to the model
+shorten_stats = {"avoided": 0, "round_trips": 0}
+_shorten_stats_lock = threading.Lock()
+
+
+def _words(text: str) -> set[str]:
+    return set(re.findall(r"[a-z0-9][a-z0-9+#]*", text.lower()))
+
+
+def _trigger_terms(eval_results: dict) -> set[str]:
+    """Words from the eval queries, minus stopwords.
+
+    Queries the skill should not trigger on count too: a description that
+    names them is drawing a boundary worth keeping.
+    """
+    terms: set[str] = set()
+    for r in eval_results["results"]:
+        terms |= {w for w in _words(r["query"]) if len(w) > 2 and w not in STOPWORDS}
+    return terms
+
+
+def _sentences(text: str) -> list[str]:
+    sentences: list[str] = []
+    for part in re.split(r"(?<=[.!?;])\s+", text):
+        if sentences and re.search(r"\b(?:e\.g|i\.e|vs)\.$", sentences[-1]):
+            sentences[-1] += " " + part
+        else:
+            sentences.append(part)
+    return [s for s in sentences if s]
+
+
+def _compress_description(
+    description: str, key_terms: set[str], limit: int = MAX_DESCRIPTION_CHARS,
+) -> tuple[str | None, list[dict]]:
+    """Deterministically shorten description to fit limit, or None if it can't.
+
+    Stages run in order until the text fits: collapse whitespace, rewrite
+    wordy filler phrases, drop repeated sentences and repeated comma-list
+    items, then drop the lowest-ranked sentences. Sentences rank by how
+    many key terms they carry; the first sentence and any sentence that is
+    the last one carrying a key term are never dropped. Every key term in
+    the original must survive, otherwise the result is rejected. Returns
+    the result and the size after each stage that ran.
+    """
+    required = key_terms & _words(description)
+    steps: list[dict] = []
+    text = " ".join(description.split())
+    steps.append({"step": "whitespace", "chars": len(text)})
+
+    if len(text) > limit:
+        for pattern, replacement in FILLER_REWRITES:
+            text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
+        steps.append({"step": "filler", "chars": len(text)})
+
+    if len(text) > limit:
+        seen: set[str] = set()
+        kept = []
+        for sentence in _sentences(text):
+            key = " ".join(sorted(_words(sentence)))
+            if key in seen:
+                continue
+            seen.add(key)
+            items: list[str] = []
+            for item in sentence.split(", "):
+                if item.lower() not in (i.lower() for i in items):
+                    items.append(item)
+            kept.append(", ".join(items))
+        text = " ".join(kept)
+        steps.append({"step": "dedupe", "chars": len(text)})
+
+    if len(text) > limit:
+        sentences = _sentences(text)
+        while len(" ".join(sentences)) > limit:
+            droppable = []
+            for i in range(1, len(sentences)):
+                rest = _words(" ".join(sentences[:i] + sentences[i + 1:]))
+                if required <= rest:
+                    droppable.append((len(_words(sentences[i]) & key_terms), -i))
+            if not droppable:
+                break
+            del sentences[-min(droppable)[1]]
+        text = " ".join(sentences)
+        steps.append({"step": "rank_sentences", "chars": len(text)})
+
+    if len(text) > limit or not required <= _words(text):
+        return None, steps
+    return text, steps
+
+
+def _parse_description(text: str) -> str:
     match = re.search(r"<new_description>(.*?)</new_description>", text, re.DOTALL)
-    description = match.group(1).strip().strip('"') if match else text.strip().strip('"')
+    return match.group(1).strip().strip('"') if match else text.strip().strip('"')
+
+
+def _generate(
+    prompt: str,
+    model: str,
+    pool: ClaudePool | None,
+    cache: ResponseCache | None = None,
+    key_terms: set[str] = frozenset(),
+) -> tuple[str, dict]:
+    """One candidate description for prompt, plus its transcript.
+
+    key_terms are the trigger words a locally shortened description must
+    keep (see _compress_description).
+    """
+    text = _call_claude(prompt, model, pool=pool, cache=cache)
+
+    description = _parse_description(text)
 
     transcript: dict = {
-        "iteration": iteration,
         "prompt": prompt,
         "response": text,
         "parsed_description": description,
         "char_count": len(description),
-        "over_limit": len(description) > 1024,
+        "over_limit": len(description) > MAX_DESCRIPTION_CHARS,
     }
 
     # Safety net: the prompt already states the 1024-char hard limit, but if
-    # the model blew past it anyway, make one fresh single-turn call that
+    # the model blew past it anyway, first try to shorten it locally, which
+    # costs nothing. Only if that fails, make one fresh single-turn call that
     # quotes the too-long version and asks for a shorter rewrite. (The old
     # SDK path did this as a true multi-turn; `claude -p` is one-shot, so we
     # inline the prior output into the new prompt instead.)
-    if len(description) > 1024:
+    if len(description) > MAX_DESCRIPTION_CHARS:
+        compressed, steps = _compress_description(description, key_terms)
+        transcript["local_compression"] = {
+            "steps": steps,
+            "avoided_round_trip": compressed is not None,
+        }
+        with _shorten_stats_lock:
+            shorten_stats["avoided" if compressed is not None else "round_trips"] += 1
+        if compressed is not None:
+            description = compressed
+
+    if len(description) > MAX_DESCRIPTION_CHARS:
         shorten_prompt = (
             f"{prompt}\n\n"
             f"---\n\n"
@@ -171,9 +747,8 @@ Please respond with only the new description text in <new_description> tags, not
             f"important trigger words and intent coverage. Respond with only "
             f"the new description in <new_description> tags."
         )
-        shorten_text = _call_claude(shorten_prompt, model)
-        match = re.search(r"<new_description>(.*?)</new_description>", shorten_text, re.DOTALL)
-        shortened = match.group(1).strip().strip('"') if match else shorten_text.strip().strip('"')
+        shorten_text = _call_claude(shorten_prompt, model, pool=pool, cache=cache)
+        shortened = _parse_description(shorten_text)
 
         transcript["rewrite_prompt"] = shorten_prompt
         transcript["rewrite_response"] = shorten_text
@@ -183,22 +758,153 @@ Please respond with only the new description text in <new_description> tags, not
 
     transcript["final_description"] = description
 
+    return description, transcript
+
+
+def _warm_for(
+    pool: ClaudePool | None, cache: ResponseCache | None, model: str, prompts: list[str],
+) -> None:
+    """Warm a worker per prompt the cache can't answer, plus one spare for a shorten retry."""
+    if pool is None:
+        return
+    uncached = sum(1 for prompt in prompts if cache is None or not cache.contains(model, prompt))
+    if uncached:
+        pool.warm(uncached + 1)
+
+
+def _write_log(log_dir: Path | None, iteration: int | None, transcript: dict) -> None:
     if log_dir:
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / f"improve_iter_{iteration or 'unknown'}.json"
         log_file.write_text(json.dumps(transcript, indent=2))
 
+
+def improve_description(
+    skill_name: str,
+    skill_content: str,
+    current_description: str,
+    eval_results: dict,
+    history: list[dict],
+    model: str,
+    test_results: dict | None = None,
+    log_dir: Path | None = None,
+    iteration: int | None = None,
+    pool: ClaudePool | None = None,
+    cache: ResponseCache | None = None,
+    prompt_budget: int = DEFAULT_PROMPT_BUDGET,
+) -> str:
+    """Call Claude to improve the description based on eval results.
+
+    Pass a ClaudePool to start the spare worker for a possible shorten
+    retry while the first call runs, and a ResponseCache to skip calls
+    whose prompt was already answered. Prompts over prompt_budget chars are
+    compacted (see _fit_prompt).
+    """
+    prompt, budget_report = _fit_prompt(
+        lambda hist, omitted, content, **compact: _build_prompt(
+            skill_name, content, current_description, eval_results, hist, test_results,
+            omitted_attempts=omitted, **compact,
+        ),
+        history, skill_content, prompt_budget,
+    )
+    _warm_for(pool, cache, model, [prompt])
+    description, transcript = _generate(prompt, model, pool, cache, _trigger_terms(eval_results))
+    _write_log(log_dir, iteration, {"iteration": iteration, **transcript, "prompt_budget": budget_report})
     return description
 
 
+def improve_description_beam(
+    skill_name: str,
+    skill_content: str,
+    current_description: str,
+    eval_results: dict,
+    history: list[dict],
+    model: str,
+    beam: int,
+    test_results: dict | None = None,
+    log_dir: Path | None = None,
+    iteration: int | None = None,
+    pool: ClaudePool | None = None,
+    cache: ResponseCache | None = None,
+    prompt_budget: int = DEFAULT_PROMPT_BUDGET,
+) -> list[str]:
+    """Generate `beam` candidate descriptions concurrently, for scoring by the caller.
+
+    Each candidate's prompt carries a different style hint from STYLE_HINTS,
+    so the candidates explore different phrasings of the same feedback. The
+    beam is capped at len(STYLE_HINTS): a repeated hint would repeat a prompt
+    (and, through the cache, its answer). Calls run in a thread pool; a ClaudePool
+    warmed for `beam` calls beforehand has them all start warm. Candidates are
+    returned in hint order and logged together in one transcript. A failed
+    call only drops its candidate; the first error is raised if all fail.
+    """
+    beam = min(beam, len(STYLE_HINTS))
+    fitted = [
+        _fit_prompt(
+            lambda hist, omitted, content, hint=STYLE_HINTS[i], **compact: _build_prompt(
+                skill_name, content, current_description, eval_results, hist, test_results,
+                style_hint=hint, omitted_attempts=omitted, **compact,
+            ),
+            history, skill_content, prompt_budget,
+        )
+        for i in range(beam)
+    ]
+    key_terms = _trigger_terms(eval_results)
+    _warm_for(pool, cache, model, [prompt for prompt, _ in fitted])
+
+    def generate(fit: tuple[str, dict]) -> tuple[str | None, dict, Exception | None]:
+        prompt, budget_report = fit
+        try:
+            description, transcript = _generate(prompt, model, pool, cache, key_terms)
+            return description, {**transcript, "prompt_budget": budget_report}, None
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            return None, {"prompt": prompt, "error": str(e), "prompt_budget": budget_report}, e
+
+    with ThreadPoolExecutor(max_workers=beam) as executor:
+        results = list(executor.map(generate, fitted))
+
+    _write_log(log_dir, iteration, {
+        "iteration": iteration,
+        "beam": beam,
+        "candidates": [
+            {"style_hint": STYLE_HINTS[i], **transcript}
+            for i, (_, transcript, _) in enumerate(results)
+        ],
+    })
+    candidates = [description for description, _, _ in results if description is not None]
+    if not candidates:
+        raise results[0][2]
+    return candidates
+
+
 def main():
     parser = argparse.ArgumentParser(description="Improve a skill description based on eval results")
     parser.add_argument("--eval-results", required=True, help="Path to eval results JSON (from run_eval.py)")
     parser.add_argument("--skill-path", required=True, help="Path to skill directory")
     parser.add_argument("--history", default=None, help="Path to history JSON (previous attempts)")
     parser.add_argument("--model", required=True, help="Model for improvement")
+    parser.add_argument(
+        "--beam", type=int, default=1,
+        help=f"Generate this many candidates concurrently, each with a different style hint "
+             f"(at most {len(STYLE_HINTS)}; output gains a \"candidates\" list; \"description\" is the first)",
+    )
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="Directory for cached model responses (default: $XDG_CACHE_HOME/skill-creator/improve_description)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Always call the model; don't read or write the response cache")
+    parser.add_argument("--cache-ttl", type=float, default=7, help="Days before a cached response expires (default: 7)")
+    parser.add_argument("--cache-max-mb", type=float, default=100, help="Evict least recently used responses above this size (default: 100)")
+    parser.add_argument(
+        "--prompt-budget", type=int, default=DEFAULT_PROMPT_BUDGET,
+        help=f"Compact history and skill content to keep the prompt under this many chars "
+             f"(default: {DEFAULT_PROMPT_BUDGET}; 0 disables)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Print thinking to stderr")
     args = parser.parse_args()
+    if args.beam > len(STYLE_HINTS):
+        print(f"Note: --beam capped at {len(STYLE_HINTS)}, the number of style hints", file=sys.stderr)
+        args.beam = len(STYLE_HINTS)
 
     skill_path = Path(args.skill_path)
     if not (skill_path / "SKILL.md").exists():
@@ -217,17 +923,60 @@ def main():
         print(f"Current: {current_description}", file=sys.stderr)
         print(f"Score: {eval_results['summary']['passed']}/{eval_results['summary']['total']}", file=sys.stderr)
 
-    new_description = improve_description(
-        skill_name=name,
-        skill_content=content,
-        current_description=current_description,
-        eval_results=eval_results,
-        history=history,
-        model=args.model,
-    )
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(
+            Path(args.cache_dir) if args.cache_dir else default_cache_dir(),
+            ttl=args.cache_ttl * 86400,
+            max_bytes=int(args.cache_max_mb * 1024 * 1024),
+        )
+
+    # Workers start only for calls the cache can't answer, so a fully cached
+    # replay runs without the claude CLI
+    candidates = None
+    try:
+        with ClaudePool(args.model, size=max(1, args.beam) + 1) as pool:
+            if args.beam > 1:
+                candidates = improve_description_beam(
+                    skill_name=name,
+                    skill_content=content,
+                    current_description=current_description,
+                    eval_results=eval_results,
+                    history=history,
+                    model=args.model,
+                    beam=args.beam,
+                    pool=pool,
+                    cache=cache,
+                    prompt_budget=args.prompt_budget,
+                )
+                new_description = candidates[0]
+            else:
+                new_description = improve_description(
+                    skill_name=name,
+                    skill_content=content,
+                    current_description=current_description,
+                    eval_results=eval_results,
+                    history=history,
+                    model=args.model,
+                    pool=pool,
+                    cache=cache,
+                    prompt_budget=args.prompt_budget,
+                )
+    except FileNotFoundError as e:
+        print(f"Error: {e.filename or 'claude'} not found (needed for prompts not in the response cache)", file=sys.stderr)
+        sys.exit(1)
 
     if args.verbose:
-        print(f"Improved: {new_description}", file=sys.stderr)
+        for candidate in candidates or [new_description]:
+            print(f"Improved: {candidate}", file=sys.stderr)
+        if cache is not None:
+            print(f"Response cache: {cache.hits} hits, {cache.misses} misses", file=sys.stderr)
+        if shorten_stats["avoided"] or shorten_stats["round_trips"]:
+            print(
+                f"Over-long descriptions: {shorten_stats['avoided']} shortened locally, "
+                f"{shorten_stats['round_trips']} sent back to the model",
+                file=sys.stderr,
+            )
 
     # Output as JSON with both the new description and updated history
     output = {
@@ -240,6 +989,8 @@ def main():
             "results": eval_results["results"],
         }],
     }
+    if candidates is not None:
+        output["candidates"] = candidates
     print(json.dumps(output, indent=2))
 
 
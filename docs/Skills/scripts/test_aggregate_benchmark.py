@@ -0,0 +1,194 @@
+"""Tests for aggregate_benchmark.py's streaming stats and partial merging.
+
+Run with: python -m pytest docs/Skills/scripts/test_aggregate_benchmark.py
+"""
+
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import aggregate_benchmark  # noqa: E402
+from aggregate_benchmark import (  # noqa: E402
+    RunningStats,
+    bootstrap_delta,
+    generate_benchmark,
+    generate_partial,
+    merge_partials,
+    write_sqlite_store,
+)
+
+
+def _write_run(root: Path, eval_id: int, config: str, run: int, passed: int, seconds: float) -> None:
+    run_dir = root / f"eval-{eval_id}" / config / f"run-{run}"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    (run_dir / "grading.json").write_text(json.dumps({
+        "summary": {"pass_rate": passed / 4, "passed": passed, "failed": 4 - passed, "total": 4},
+        "timing": {"total_duration_seconds": seconds},
+        "execution_metrics": {"total_tool_calls": run, "output_chars": 100 * passed},
+        "expectations": [{"text": "ok", "passed": True, "evidence": ""}],
+    }))
+
+
+def _make_benchmark(root: Path, eval_ids) -> None:
+    for eval_id in eval_ids:
+        for config, offset in (("with_skill", 1), ("without_skill", 0)):
+            for run in (1, 2, 3):
+                _write_run(root, eval_id, config, run, (eval_id + run + offset) % 5, 10.0 * run + eval_id)
+
+
+def _comparable(benchmark: dict) -> dict:
+    return {**benchmark, "metadata": {**benchmark["metadata"], "timestamp": None}}
+
+
+@pytest.mark.parametrize("values", [
+    [],
+    [7.0],
+    [0.25, 0.5, 0.75, 1.0],
+    [1e9 + v for v in (4.0, 7.0, 13.0, 16.0)],  # large offset: naive sum of squares loses this
+    [random.Random(3).gauss(50, 12) for _ in range(1000)],
+])
+def test_running_stats_match_direct_calculation(values):
+    acc = RunningStats()
+    for value in values:
+        acc.add(value)
+    summary = acc.summary()
+
+    if not values:
+        assert summary == {"mean": 0.0, "stddev": 0.0, "min": 0.0, "max": 0.0}
+        return
+    assert summary["mean"] == pytest.approx(statistics.fmean(values), abs=1e-4)
+    assert summary["stddev"] == pytest.approx(statistics.stdev(values) if len(values) > 1 else 0.0, abs=1e-4)
+    assert (summary["min"], summary["max"]) == (round(min(values), 4), round(max(values), 4))
+
+    # Merging any split gives the same accumulator as one pass
+    for cut in (0, len(values) // 3, len(values)):
+        left, right = RunningStats(), RunningStats()
+        for value in values[:cut]:
+            left.add(value)
+        for value in values[cut:]:
+            right.add(value)
+        left.merge(RunningStats.from_dict(json.loads(json.dumps(right.to_dict()))))
+        assert left.summary() == pytest.approx(summary, abs=1e-4)
+
+
+def test_percentiles_close_to_exact_quantiles():
+    values = [random.Random(5).expovariate(0.1) for _ in range(5000)]
+    acc = RunningStats(percentiles=True)
+    for value in values:
+        acc.add(value)
+    exact = statistics.quantiles(values, n=100)
+    summary = acc.summary()
+    for p in (50, 90, 99):
+        assert summary[f"p{p}"] == pytest.approx(exact[p - 1], rel=0.05)
+
+
+def test_run_cache_rereads_only_changed_runs(tmp_path, monkeypatch):
+    _make_benchmark(tmp_path / "bench", (1, 2))
+    cache_path = tmp_path / "bench.cache.json"
+    loaded = []
+    load_run = aggregate_benchmark._load_run
+    monkeypatch.setattr(aggregate_benchmark, "_load_run", lambda run: loaded.append(run["dir"]) or load_run(run))
+
+    first = generate_benchmark(tmp_path / "bench", cache_path=cache_path)
+    assert len(loaded) == 12
+
+    loaded.clear()
+    assert _comparable(generate_benchmark(tmp_path / "bench", cache_path=cache_path)) == _comparable(first)
+    assert loaded == []
+
+    changed = tmp_path / "bench" / "eval-2" / "with_skill" / "run-3"
+    _write_run(tmp_path / "bench", 2, "with_skill", 3, 4, 99.0)
+    os.utime(changed / "grading.json", ns=(1, 1))  # a different stamp even on coarse clocks
+    loaded.clear()
+    cached = generate_benchmark(tmp_path / "bench", cache_path=cache_path)
+    assert loaded == [changed]
+    assert _comparable(cached) == _comparable(generate_benchmark(tmp_path / "bench"))
+
+
+@pytest.mark.parametrize("percentiles", [False, True])
+def test_merge_matches_single_pass(tmp_path, percentiles):
+    # eval-10 sorts before eval-2 by name; both passes must still agree
+    _make_benchmark(tmp_path / "all", (1, 2, 10))
+    _make_benchmark(tmp_path / "shard-a", (2, 10))
+    _make_benchmark(tmp_path / "shard-b", (1,))
+
+    single = generate_benchmark(tmp_path / "all", percentiles=percentiles)
+    partials = [generate_partial(tmp_path / name, percentiles=percentiles) for name in ("shard-a", "shard-b")]
+    merged = merge_partials(partials)
+
+    assert _comparable(merged) == _comparable(single)
+    assert [(r["eval_id"], r["run_number"]) for r in merged["runs"][:4]] == [(1, 1), (1, 2), (1, 3), (2, 1)]
+
+
+def test_bootstrap_delta_brackets_the_observed_difference():
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    primary = [rng.gauss(0.8, 0.1) for _ in range(40)]
+    baseline = [rng.gauss(0.5, 0.1) for _ in range(40)]
+    observed = statistics.fmean(primary) - statistics.fmean(baseline)
+
+    result = bootstrap_delta(primary, baseline, resamples=2000)
+    assert result["ci_low"] < observed < result["ci_high"]
+    assert result["ci_low"] > 0 and result["p_value"] < 0.01
+    assert bootstrap_delta(primary, baseline, resamples=2000) == result
+
+    same = bootstrap_delta(baseline[:20], baseline[20:], resamples=2000)
+    assert same["ci_low"] < 0 < same["ci_high"] and same["p_value"] > 0.05
+    assert bootstrap_delta(primary, [], resamples=10) is None
+
+
+def test_bootstrap_merge_matches_single_pass(tmp_path):
+    pytest.importorskip("numpy")
+    _make_benchmark(tmp_path / "all", (1, 2, 10))
+    _make_benchmark(tmp_path / "shard-a", (10, 2))
+    _make_benchmark(tmp_path / "shard-b", (1,))
+
+    single = generate_benchmark(tmp_path / "all", bootstrap=500)
+    merged = merge_partials(
+        [generate_partial(tmp_path / name) for name in ("shard-a", "shard-b")], bootstrap=500,
+    )
+    assert "significance" in single["run_summary"]["delta"]
+    assert merged["run_summary"] == single["run_summary"]
+
+
+def test_merge_rejects_mixed_percentiles(tmp_path):
+    _make_benchmark(tmp_path / "shard-a", (1,))
+    _make_benchmark(tmp_path / "shard-b", (2,))
+    partials = [
+        generate_partial(tmp_path / "shard-a", percentiles=True),
+        generate_partial(tmp_path / "shard-b", percentiles=False),
+    ]
+    with pytest.raises(ValueError, match="percentiles"):
+        merge_partials(partials)
+
+
+def test_sqlite_store_holds_every_run(tmp_path):
+    _make_benchmark(tmp_path / "bench", (1, 2))
+    benchmark = generate_benchmark(tmp_path / "bench")
+    db_path = tmp_path / "benchmark.sqlite"
+    write_sqlite_store(benchmark, db_path)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT eval_id, configuration, run_number, pass_rate, time_seconds FROM runs"
+            " ORDER BY rowid"
+        ).fetchall()
+        expectations = conn.execute("SELECT COUNT(*) FROM expectations").fetchone()[0]
+        skill_name = json.loads(conn.execute("SELECT value FROM metadata WHERE key = 'skill_name'").fetchone()[0])
+    finally:
+        conn.close()
+    assert rows == [
+        (r["eval_id"], r["configuration"], r["run_number"], r["result"]["pass_rate"], r["result"]["time_seconds"])
+        for r in benchmark["runs"]
+    ]
+    assert expectations == len(benchmark["runs"])
+    assert skill_name == benchmark["metadata"]["skill_name"]
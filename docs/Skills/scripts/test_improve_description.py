@@ -0,0 +1,228 @@
+"""Tests for improve_description.py that run against a stub `claude` CLI.
+
+Run with: python -m pytest docs/Skills/scripts/test_improve_description.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+pytest.importorskip("scripts.utils", reason="improve_description imports scripts.utils")
+
+from scripts.improve_description import (  # noqa: E402
+    ClaudePool,
+    ResponseCache,
+    STYLE_HINTS,
+    _build_prompt,
+    _compress_description,
+    _fit_prompt,
+    improve_description,
+    improve_description_beam,
+)
+
+STUB = """\
+import os, sys, time
+time.sleep(float(os.environ.get("STUB_STARTUP", "0")))
+prompt = sys.stdin.read()
+if "STUB_FAIL" in prompt:
+    print("boom", file=sys.stderr)
+    sys.exit(3)
+if "STUB_HANG" in prompt:
+    time.sleep(60)
+with open(os.environ["STUB_LOG"], "a") as log:
+    log.write("call\\n")
+print(f"<new_description>Use this skill for {len(prompt)} chars</new_description>")
+"""
+
+EVAL_RESULTS = {
+    "results": [{"query": "make a chart", "should_trigger": True, "pass": False, "triggers": 0, "runs": 3}],
+    "summary": {"passed": 0, "failed": 1, "total": 1},
+}
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    script = tmp_path / "claude_stub.py"
+    script.write_text(STUB)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("STUB_LOG", str(log))
+    monkeypatch.setenv("STUB_STARTUP", "0.5")
+    return (sys.executable, str(script)), log
+
+
+def _calls(log: Path) -> int:
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+def test_warm_worker_skips_startup(stub):
+    command, _ = stub
+    with ClaudePool(None, size=2, command=command) as pool:
+        start = time.monotonic()
+        assert "Use this skill" in pool.call("cold")
+        cold = time.monotonic() - start
+
+        pool.warm(1)
+        time.sleep(0.8)
+        start = time.monotonic()
+        assert "Use this skill" in pool.call("warm")
+        warm = time.monotonic() - start
+    assert cold >= 0.5
+    assert warm < 0.4
+
+
+def test_close_kills_idle_workers(stub):
+    command, _ = stub
+    pool = ClaudePool(None, size=3, command=command)
+    pool.warm()
+    procs = [proc for proc, _ in list(pool._idle.queue)]
+    assert len(procs) == 3
+    pool.close()
+    assert all(proc.poll() is not None for proc in procs)
+
+
+def test_failures_raise(stub):
+    command, _ = stub
+    with ClaudePool(None, command=command) as pool:
+        with pytest.raises(RuntimeError, match="exited 3"):
+            pool.call("STUB_FAIL")
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.call("STUB_HANG", timeout=1)
+
+
+def test_beam_is_capped_at_style_hints(stub):
+    command, log = stub
+    with ClaudePool(None, size=len(STYLE_HINTS) + 1, command=command) as pool:
+        candidates = improve_description_beam(
+            "skill", "content", "old description", EVAL_RESULTS, [], None,
+            beam=len(STYLE_HINTS) + 4, pool=pool,
+        )
+    assert len(candidates) == len(set(candidates)) == len(STYLE_HINTS)
+    assert _calls(log) == len(STYLE_HINTS)
+
+
+def test_cached_prompt_starts_no_worker(stub, tmp_path):
+    command, log = stub
+    cache = ResponseCache(tmp_path / "cache")
+    args = ("skill", "content", "old description", EVAL_RESULTS, [], None)
+
+    with ClaudePool(None, size=2, command=command) as pool:
+        first = improve_description(*args, pool=pool, cache=cache)
+    assert _calls(log) == 1
+
+    with ClaudePool(None, size=2, command=command) as pool:
+        assert improve_description(*args, pool=pool, cache=cache) == first
+        assert pool._idle.qsize() == 0
+    assert _calls(log) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.parametrize("sentence", [
+    "Use it not just for PDFs but also for images.",
+    "It is not very good at charts.",
+    "It isn't really meant for CSV files.",
+    "Use it only very rarely.",
+    "Simply attach a file and ask.",
+])
+def test_compression_keeps_qualifiers(sentence):
+    filler = "Then it can help in order to make reports. " * 40
+    compressed, _ = _compress_description(sentence + " " + filler, set())
+    assert compressed is not None and compressed.startswith(sentence)
+
+
+def test_compression_keeps_key_terms_and_first_sentence():
+    description = (
+        "Use this skill to build charts from spreadsheet data. "
+        + "It is able to help in order to make things look nice. " * 15
+        + "It handles charts, pivot tables, pivot tables, dashboards. "
+        + "Results look great every time and everyone will be happy with them. "
+        + "Do not use it for writing essays."
+    )
+    key_terms = {"charts", "spreadsheet", "pivot", "dashboards", "essays", "unrelated"}
+    compressed, steps = _compress_description(description, key_terms, limit=200)
+
+    assert compressed is not None and len(compressed) <= 200
+    assert compressed.startswith("Use this skill to build charts from spreadsheet data.")
+    assert {"pivot", "dashboards", "essays"} <= set(compressed.lower().replace(".", " ").replace(",", " ").split())
+    assert compressed.count("pivot tables") == 1
+    assert "Results look great" not in compressed
+    assert [step["step"] for step in steps] == ["whitespace", "filler", "dedupe", "rank_sentences"]
+
+
+def test_compression_gives_up_rather_than_lose_key_terms():
+    description = "Use it for " + ", ".join(f"term{i}" for i in range(60)) + "."
+    compressed, _ = _compress_description(description, {f"term{i}" for i in range(60)}, limit=100)
+    assert compressed is None
+
+
+def test_short_description_is_left_alone():
+    compressed, steps = _compress_description("Use  it   for really   simple charts.", set())
+    assert compressed == "Use it for really simple charts."
+    assert [step["step"] for step in steps] == ["whitespace"]
+
+
+def test_cache_entries_expire_after_ttl(tmp_path, monkeypatch):
+    cache = ResponseCache(tmp_path, ttl=60)
+    cache.put("model", "prompt", "answer")
+    assert cache.get("model", "prompt") == "answer"
+    assert cache.get("other-model", "prompt") is None
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 61)
+    assert cache.get("model", "prompt") is None
+    assert not cache.contains("model", "prompt")
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=10**6)
+    for prompt in ("a", "b"):
+        cache.put(None, prompt, prompt * 100)
+    size = cache._path(None, "a").stat().st_size
+    for age, prompt in ((300, "a"), (200, "b")):
+        past = time.time() - age
+        os.utime(cache._path(None, prompt), (past, past))
+
+    cache.max_bytes = int(size * 2.5)
+    assert cache.get(None, "a") == "a" * 100  # now the most recently used
+    cache.put(None, "c", "c" * 100)
+    assert [cache.contains(None, p) for p in "abc"] == [True, False, True]
+
+
+def test_unusable_cache_dir_warns_and_continues(stub, tmp_path, capsys):
+    command, log = stub
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    cache = ResponseCache(blocker / "cache")
+    args = ("skill", "content", "old description", EVAL_RESULTS, [], None)
+
+    with ClaudePool(None, command=command) as pool:
+        assert improve_description(*args, pool=pool, cache=cache).startswith("Use this skill")
+        assert improve_description(*args, pool=pool, cache=cache).startswith("Use this skill")
+    assert cache.disabled
+    assert _calls(log) == 2
+    assert capsys.readouterr().err.count("response cache disabled") == 1
+
+
+def test_fit_prompt_compacts_failure_lists():
+    results = [
+        {"query": f"query {i} " + "make a chart of the sales data " * 40, "should_trigger": i % 2 == 0,
+         "pass": False, "triggers": 1, "runs": 3}
+        for i in range(40)
+    ]
+    eval_results = {"results": results, "summary": {"passed": 0, "failed": 40, "total": 40}}
+
+    def build(history, omitted, content, **compact):
+        return _build_prompt("skill", content, "old", eval_results, history, omitted_attempts=omitted, **compact)
+
+    prompt, report = _fit_prompt(build, [], "skill body " * 500, 8000)
+    assert len(prompt) <= 8000 and not report["over_budget"]
+    assert "query 0 " in prompt and "more not shown" in prompt
+
+    prompt, report = _fit_prompt(build, [], "skill body " * 500, 100)
+    assert report["over_budget"] and report["final_chars"] == len(prompt)